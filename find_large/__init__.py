@@ -4,11 +4,31 @@ This package provides functionality to search for and list files larger than a s
 in a given directory, with options for different output formats and filtering.
 """
 
-from find_large.cli import main as main
-
 __version__ = "0.2.1"
 __author__ = "elvee"
 __description__ = (
     "A command-line utility to help you identify space-consuming files and directories"
 )
 __license__ = "MIT"
+
+
+def __getattr__(name: str) -> object:
+    """Import the ``main`` entry point on first use.
+
+    The installed scripts import submodules of this package, so the unified
+    ``find_large.cli`` group is only built when it is actually run.
+
+    Args:
+        name: Attribute looked up on the package.
+
+    Returns:
+        object: The ``find_large.cli.main`` entry point.
+
+    Raises:
+        AttributeError: If ``name`` is not ``main``.
+    """
+    if name == "main":
+        from find_large.cli import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,159 @@
+"""Persistent cache of directory listings shared between scans."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import click
+
+from find_large import formatting
+from find_large.constants import CACHE_FILE, DEFAULT_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+Listing = tuple[list[tuple[str, int]], list[str]]
+
+# Bumped whenever the table layout changes; older caches are dropped and rebuilt
+SCHEMA_VERSION = 2
+# Seconds to wait for another scan's write to finish before giving up on a write
+BUSY_TIMEOUT = 30.0
+
+
+class ScanCache:
+    """SQLite-backed cache of directory listings keyed by path.
+
+    Each row holds the direct (non-recursive) listing of one directory: the sizes of
+    its visible regular files and the paths of its visible subdirectories. A row is
+    only used while the directory's ``(st_dev, st_ino, st_mtime_ns)`` are unchanged,
+    so a directory replaced at the same path (e.g. restored with its old mtime) is
+    listed again. A directory's mtime only changes when entries are added, removed
+    or renamed, not when an existing file grows, so entries also expire after
+    ``ttl`` seconds.
+
+    Every listing is committed on its own, so scans sharing the database only wait
+    for each other's single-row writes.
+    """
+
+    def __init__(self, path: str = CACHE_FILE, ttl: float = DEFAULT_CACHE_TTL) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Location of the sqlite database.
+            ttl: Maximum age of a cached listing in seconds.
+        """
+        self.path = path
+        self.ttl = ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS dirs")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+            "dev INTEGER NOT NULL, ino INTEGER NOT NULL, "
+            "scanned_at REAL NOT NULL, listing TEXT NOT NULL)"
+        )
+
+    def get(self, path: str, mtime_ns: int, dev: int = 0, ino: int = 0) -> Listing | None:
+        """Return the cached listing of a directory if it is still valid.
+
+        Args:
+            path: Directory path.
+            mtime_ns: Current ``st_mtime_ns`` of the directory.
+            dev: Current ``st_dev`` of the directory.
+            ino: Current ``st_ino`` of the directory.
+
+        Returns:
+            Listing | None: The cached (path, size) pairs and subdirectories, or None
+                on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, dev, ino, scanned_at, listing FROM dirs WHERE path = ?", (path,)
+            ).fetchone()
+        if row is None or row[:3] != (mtime_ns, dev, ino) or time.time() - row[3] > self.ttl:
+            return None
+        files, subdirs = json.loads(row[4])
+        return [(file_path, size) for file_path, size in files], subdirs
+
+    def put(
+        self,
+        path: str,
+        mtime_ns: int,
+        files: list[tuple[str, int]],
+        subdirs: list[str],
+        dev: int = 0,
+        ino: int = 0,
+    ) -> None:
+        """Store the listing of a directory.
+
+        The cache is best effort: if the database stays locked by another scan, the
+        listing is not stored and the scan carries on.
+
+        Args:
+            path: Directory path.
+            mtime_ns: ``st_mtime_ns`` of the directory when it was listed.
+            files: (path, size) pairs of the files directly inside it.
+            subdirs: Paths of its subdirectories.
+            dev: ``st_dev`` of the directory when it was listed.
+            ino: ``st_ino`` of the directory when it was listed.
+        """
+        listing = json.dumps([files, subdirs], separators=(",", ":"))
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO dirs (path, mtime_ns, dev, ino, scanned_at, listing) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, mtime_ns, dev, ino, time.time(), listing),
+                )
+            except sqlite3.OperationalError as e:
+                logger.debug("Could not cache listing of %s: %s", path, e)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ScanCache":
+        """Return the cache for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the cache when leaving a ``with`` block."""
+        self.close()
+
+
+def open_cache(enabled: bool, ttl: float, path: str | None = None) -> ScanCache | None:
+    """Open the persistent scan cache if it was requested.
+
+    Args:
+        enabled: Whether caching is enabled.
+        ttl: Maximum age of a cached listing in seconds.
+        path: Location of the cache database, or None for ``CACHE_FILE``.
+
+    Returns:
+        The opened cache, or None if caching is disabled.
+
+    Raises:
+        click.Abort: If the cache database cannot be opened.
+    """
+    if not enabled:
+        return None
+    if path is None:
+        path = CACHE_FILE
+    try:
+        return ScanCache(path, ttl)
+    except (OSError, sqlite3.Error) as e:
+        formatting.print_error(f"Could not open cache '{path}': {e}")
+        raise click.Abort() from e
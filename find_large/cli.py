@@ -1,21 +1,51 @@
 """Command-line interface for find-large."""
 
-from pathlib import Path
+import importlib
+import os
+import re
+from collections.abc import Callable
 
 import click
 from click import Context
 
 from find_large import formatting
 from find_large.constants import (
+    CACHE_FILE,
+    DEFAULT_CACHE_TTL,
     DEFAULT_DIR,
+    DEFAULT_JOBS,
     DEFAULT_SIZE_GB,
     DEFAULT_SIZE_MB,
     SIZE_UNIT_GB,
     SIZE_UNIT_MB,
 )
-from find_large.dirs.scanner import DirectoryScanner
-from find_large.files.scanner import FileScanner
-from find_large.videos.scanner import VideoScanner
+
+# Section headings styled in help output
+_GROUP_HELP_STYLES: tuple[tuple[str, str], ...] = (
+    ("Usage:", click.style("Usage:", fg="green", bold=True)),
+    ("Options:", click.style("Options:", fg="green", bold=True)),
+    ("Commands:", click.style("Commands:", fg="green", bold=True)),
+)
+_COMMAND_HELP_STYLES: tuple[tuple[str, str], ...] = (
+    ("Usage:", click.style("Usage:", fg="green", bold=True)),
+    ("Options:", click.style("Options:", fg="green", bold=True)),
+    ("[Examples]", click.style("Examples:", fg="green", bold=True)),
+)
+
+# Command examples ("$ ...") and their descriptions ("Find ...:" / "List ...:")
+_EXAMPLE_LINE = re.compile(r"^[^\S\n]*(?:(\$)|(?:Find|List) (?=.*:)).*$", re.MULTILINE)
+
+
+def _style_example_line(match: re.Match[str]) -> str:
+    """Style a matched example line.
+
+    Args:
+        match: Match of ``_EXAMPLE_LINE``.
+
+    Returns:
+        The line styled as a command example or an example description.
+    """
+    return click.style(match.group(0), fg="yellow" if match.group(1) else "cyan")
 
 
 class AsciiArtHelpGroup(click.Group):
@@ -35,9 +65,8 @@ class AsciiArtHelpGroup(click.Group):
         help_text: str = super().get_help(ctx)
 
         # Style different sections
-        help_text = help_text.replace("Usage:", click.style("Usage:", fg="green", bold=True))
-        help_text = help_text.replace("Options:", click.style("Options:", fg="green", bold=True))
-        help_text = help_text.replace("Commands:", click.style("Commands:", fg="green", bold=True))
+        for heading, styled in _GROUP_HELP_STYLES:
+            help_text = help_text.replace(heading, styled)
 
         return help_text
 
@@ -59,26 +88,11 @@ class AsciiArtHelpCommand(click.Command):
         help_text: str = super().get_help(ctx)
 
         # Style different sections
-        help_text = help_text.replace("Usage:", click.style("Usage:", fg="green", bold=True))
-        help_text = help_text.replace("Options:", click.style("Options:", fg="green", bold=True))
-        help_text = help_text.replace("[Examples]", click.style("Examples:", fg="green", bold=True))
-
-        # Style command descriptions
-        lines: list[str] = help_text.split("\n")
-        styled_lines: list[str] = []
-        for line in lines:
-            if line.strip().startswith("$"):
-                # Style command examples
-                styled_lines.append(click.style(line, fg="yellow"))
-            elif (
-                line.strip().startswith("Find ") or line.strip().startswith("List ")
-            ) and ":" in line:
-                # Style example descriptions
-                styled_lines.append(click.style(line, fg="cyan"))
-            else:
-                styled_lines.append(line)
-
-        return "\n".join(styled_lines)
+        for heading, styled in _COMMAND_HELP_STYLES:
+            help_text = help_text.replace(heading, styled)
+
+        # Style command examples and their descriptions
+        return _EXAMPLE_LINE.sub(_style_example_line, help_text)
 
 
 def validate_size_options(size_gb: float | None, size_mb: float | None) -> tuple[float, str]:
@@ -128,7 +142,7 @@ def validate_directory(directory: str) -> None:
     Raises:
         click.Abort: If directory does not exist or is not accessible.
     """
-    if not Path(directory).is_dir():
+    if not os.path.isdir(directory):
         formatting.print_error(f"Directory '{directory}' does not exist or is not accessible.")
         raise click.Abort()
 
@@ -143,225 +157,215 @@ def cli() -> None:
     pass
 
 
-@cli.command(cls=AsciiArtHelpCommand)
-@click.option(
-    "-d",
-    "--directory",
-    "directory",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True),
-    default=DEFAULT_DIR,
-    help="Directory to search (default: current directory)",
-)
-@click.option(
-    "-S",
-    "--size-in-gb",
-    "size_gb",
-    type=float,
-    help=f"Size threshold in GB (default: {DEFAULT_SIZE_GB}GB)",
-)
-@click.option(
-    "-s",
-    "--size-in-mb",
-    "size_mb",
-    type=float,
-    help=f"Size threshold in MB (default: {DEFAULT_SIZE_MB}MB)",
-)
-@click.option(
-    "-o",
-    "--output",
-    "output_file",
-    type=click.Path(dir_okay=False, writable=True),
-    help="Save results to specified file",
-)
-@click.option("-n", "--no-size", is_flag=True, help="Display files without their sizes")
-@click.option(
-    "-nt", "--no-table", is_flag=True, help="Output in plain text format (one file per line)"
-)
-@click.option("-v", "--verbose", is_flag=True, help="Enable verbose output showing search progress")
-def files(
-    directory: str,
-    size_gb: float | None,
-    size_mb: float | None,
-    output_file: str | None,
-    no_size: bool,
-    no_table: bool,
-    verbose: bool,
-) -> None:
-    r"""Find large files in a directory.
-
-    Search for files larger than a specified size in the given directory.
+_HELP_SIZE_GB: str = f"Size threshold in GB (default: {DEFAULT_SIZE_GB}GB)"
+_HELP_SIZE_MB: str = f"Size threshold in MB (default: {DEFAULT_SIZE_MB}MB)"
+
+# Options shared by every scan command, in the order they appear in --help
+_SEARCH_OPTIONS: list[Callable[[Callable[..., None]], Callable[..., None]]] = [
+    click.option(
+        "-d",
+        "--directory",
+        "directory",
+        type=click.Path(file_okay=False, dir_okay=True, resolve_path=True),
+        default=DEFAULT_DIR,
+        help="Directory to search (default: current directory)",
+    ),
+    click.option(
+        "-S",
+        "--size-in-gb",
+        "size_gb",
+        type=float,
+        help=_HELP_SIZE_GB,
+    ),
+    click.option(
+        "-s",
+        "--size-in-mb",
+        "size_mb",
+        type=float,
+        help=_HELP_SIZE_MB,
+    ),
+    click.option(
+        "-o",
+        "--output",
+        "output_file",
+        type=click.Path(dir_okay=False, writable=True),
+        help="Save results to specified file (.arrow/.parquet for columnar output)",
+    ),
+]
+
+_SCAN_OPTIONS: list[Callable[[Callable[..., None]], Callable[..., None]]] = [
+    click.option(
+        "-j",
+        "--jobs",
+        type=click.IntRange(min=1),
+        default=DEFAULT_JOBS,
+        help=(
+            f"Number of directories to scan in parallel (default: {DEFAULT_JOBS}); "
+            "with more than one, results are listed in no particular order"
+        ),
+    ),
+    click.option(
+        "--cache/--no-cache",
+        default=False,
+        help=(
+            f"Reuse directory listings from previous runs (stored in {CACHE_FILE}); "
+            "a file that grew since then keeps its old size until --cache-ttl expires"
+        ),
+    ),
+    click.option(
+        "--cache-file",
+        type=click.Path(dir_okay=False),
+        help="Store the cache in this file instead (implies --cache)",
+    ),
+    click.option(
+        "--cache-ttl",
+        type=click.FloatRange(min=0),
+        default=DEFAULT_CACHE_TTL,
+        help=f"Maximum age of cached listings in seconds (default: {DEFAULT_CACHE_TTL:g})",
+    ),
+    click.option(
+        "-x",
+        "--one-file-system",
+        is_flag=True,
+        help="Skip directories on different file systems",
+    ),
+    click.option(
+        "-v", "--verbose", is_flag=True, help="Enable verbose output showing search progress"
+    ),
+]
+
+_COMMAND_HELP: str = r"""Find large {title}.
+
+    Search for {items} larger than a specified size in the given directory.
     Results can be displayed in various formats and optionally saved to a file.
 
     \b
     [Examples]
 
     \b
-    Find files larger than 1GB:
-        $ python -m find_large files -d /path/to/search -S 1
-        $ find-large files -d /path/to/search -S 1
+    Find {noun} larger than 1GB:
+        $ python -m find_large {name} -d /path/to/search -S 1
+        $ find-large {name} -d /path/to/search -S 1
 
     \b
-    Find files larger than 500MB and save results:
-        $ python -m find_large files -d /path/to/search -s 500 -o results.txt
-        $ find-large files -d /path/to/search -s 500 -o results.txt
+    Find {noun} larger than 500MB and save results:
+        $ python -m find_large {name} -d /path/to/search -s 500 -o results.txt
+        $ find-large {name} -d /path/to/search -s 500 -o results.txt
 
     \b
-    List files without sizes in plain text format:
-        $ python -m find_large files -d /path/to/search -s 500 -n -nt
-        $ find-large files -d /path/to/search -s 500 -n -nt
+    List {noun} without sizes in plain text format:
+        $ python -m find_large {name} -d /path/to/search -s 500 -n -nt
+        $ find-large {name} -d /path/to/search -s 500 -n -nt
     """
-    validate_directory(directory)
-    size_mb, size_unit = validate_size_options(size_gb, size_mb)
-    scanner = FileScanner(directory, size_mb, output_file, size_unit, no_size, no_table, verbose)
-    scanner.run()
 
 
-@cli.command(cls=AsciiArtHelpCommand)
-@click.option(
-    "-d",
-    "--directory",
-    "directory",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True),
-    default=DEFAULT_DIR,
-    help="Directory to search (default: current directory)",
-)
-@click.option(
-    "-S",
-    "--size-in-gb",
-    "size_gb",
-    type=float,
-    help=f"Size threshold in GB (default: {DEFAULT_SIZE_GB}GB)",
-)
-@click.option(
-    "-s",
-    "--size-in-mb",
-    "size_mb",
-    type=float,
-    help=f"Size threshold in MB (default: {DEFAULT_SIZE_MB}MB)",
-)
-@click.option(
-    "-o",
-    "--output",
-    "output_file",
-    type=click.Path(dir_okay=False, writable=True),
-    help="Save results to specified file",
-)
-@click.option("-n", "--no-size", is_flag=True, help="Display directories without their sizes")
-@click.option(
-    "-nt", "--no-table", is_flag=True, help="Output in plain text format (one directory per line)"
-)
-@click.option("-v", "--verbose", is_flag=True, help="Enable verbose output showing search progress")
-def dirs(
-    directory: str,
-    size_gb: float | None,
-    size_mb: float | None,
-    output_file: str | None,
-    no_size: bool,
-    no_table: bool,
-    verbose: bool,
-) -> None:
-    r"""Find large directories.
-
-    Search for directories larger than a specified size in the given directory.
-    Results can be displayed in various formats and optionally saved to a file.
+def _make_command(
+    name: str, scanner_path: str, title: str, items: str, noun: str, noun_singular: str
+) -> click.Command:
+    """Build a scan command and register it on the ``cli`` group.
 
-    \b
-    [Examples]
-
-    \b
-    Find directories larger than 1GB:
-        $ python -m find_large dirs -d /path/to/search -S 1
-        $ find-large dirs -d /path/to/search -S 1
-
-    \b
-    Find directories larger than 500MB and save results:
-        $ python -m find_large dirs -d /path/to/search -s 500 -o results.txt
-        $ find-large dirs -d /path/to/search -s 500 -o results.txt
+    Args:
+        name: Command name.
+        scanner_path: Scanner class as ``module:ClassName``, imported on first use.
+        title: What the command finds, used in the help summary.
+        items: What the command searches for, used in the help description.
+        noun: Plural noun for the listed items.
+        noun_singular: Singular noun for the listed items.
 
-    \b
-    List directories without sizes in plain text format:
-        $ python -m find_large dirs -d /path/to/search -s 500 -n -nt
-        $ find-large dirs -d /path/to/search -s 500 -n -nt
+    Returns:
+        The registered command.
     """
-    validate_directory(directory)
-    size_mb, size_unit = validate_size_options(size_gb, size_mb)
-    scanner = DirectoryScanner(
-        directory, size_mb, output_file, size_unit, no_size, no_table, verbose
-    )
-    scanner.run()
-
-
-@cli.command(name="vids", cls=AsciiArtHelpCommand)
-@click.option(
-    "-d",
-    "--directory",
-    "directory",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True),
-    default=DEFAULT_DIR,
-    help="Directory to search (default: current directory)",
-)
-@click.option(
-    "-S",
-    "--size-in-gb",
-    "size_gb",
-    type=float,
-    help=f"Size threshold in GB (default: {DEFAULT_SIZE_GB}GB)",
-)
-@click.option(
-    "-s",
-    "--size-in-mb",
-    "size_mb",
-    type=float,
-    help=f"Size threshold in MB (default: {DEFAULT_SIZE_MB}MB)",
+
+    def command(
+        directory: str,
+        size_gb: float | None,
+        size_mb: float | None,
+        output_file: str | None,
+        no_size: bool,
+        no_table: bool,
+        jobs: int,
+        cache: bool,
+        cache_file: str | None,
+        cache_ttl: float,
+        top: int | None,
+        one_file_system: bool,
+        verbose: bool,
+    ) -> None:
+        validate_directory(directory)
+        size_mb, size_unit = validate_size_options(size_gb, size_mb)
+        module_name, class_name = scanner_path.split(":")
+        scanner_cls = getattr(importlib.import_module(module_name), class_name)
+
+        from find_large.cache import open_cache
+
+        scan_cache = open_cache(cache or cache_file is not None, cache_ttl, cache_file)
+        scanner = scanner_cls(
+            directory,
+            size_mb,
+            output_file,
+            size_unit,
+            no_size,
+            no_table,
+            verbose,
+            jobs=jobs,
+            cache=scan_cache,
+            one_file_system=one_file_system,
+            top=top,
+        )
+        try:
+            with scanner:
+                scanner.run()
+        finally:
+            if scan_cache is not None:
+                scan_cache.close()
+
+    command.__doc__ = _COMMAND_HELP.format(name=name, title=title, items=items, noun=noun)
+    options = [
+        *_SEARCH_OPTIONS,
+        click.option("-n", "--no-size", is_flag=True, help=f"Display {noun} without their sizes"),
+        click.option(
+            "-nt",
+            "--no-table",
+            is_flag=True,
+            help=f"Output in plain text format (one {noun_singular} per line)",
+        ),
+        click.option(
+            "-t",
+            "--top",
+            type=click.IntRange(min=1),
+            help=f"Only list the N largest {noun}, largest first",
+        ),
+        *_SCAN_OPTIONS,
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return cli.command(name=name, cls=AsciiArtHelpCommand)(command)
+
+
+files = _make_command(
+    "files",
+    "find_large.files.scanner:FileScanner",
+    "files in a directory",
+    "files",
+    "files",
+    "file",
 )
-@click.option(
-    "-o",
-    "--output",
-    "output_file",
-    type=click.Path(dir_okay=False, writable=True),
-    help="Save results to specified file",
+dirs = _make_command(
+    "dirs",
+    "find_large.dirs.scanner:DirectoryScanner",
+    "directories",
+    "directories",
+    "directories",
+    "directory",
 )
-@click.option("-n", "--no-size", is_flag=True, help="Display videos without their sizes")
-@click.option(
-    "-nt", "--no-table", is_flag=True, help="Output in plain text format (one video per line)"
+videos = _make_command(
+    "vids",
+    "find_large.videos.scanner:VideoScanner",
+    "video files",
+    "video files",
+    "videos",
+    "video",
 )
-@click.option("-v", "--verbose", is_flag=True, help="Enable verbose output showing search progress")
-def videos(
-    directory: str,
-    size_gb: float | None,
-    size_mb: float | None,
-    output_file: str | None,
-    no_size: bool,
-    no_table: bool,
-    verbose: bool,
-) -> None:
-    r"""Find large video files.
-
-    Search for video files larger than a specified size in the given directory.
-    Results can be displayed in various formats and optionally saved to a file.
-
-    \b
-    [Examples]
-
-    \b
-    Find videos larger than 1GB:
-        $ python -m find_large vids -d /path/to/search -S 1
-        $ find-large vids -d /path/to/search -S 1
-
-    \b
-    Find videos larger than 500MB and save results:
-        $ python -m find_large vids -d /path/to/search -s 500 -o results.txt
-        $ find-large vids -d /path/to/search -s 500 -o results.txt
-
-    \b
-    List videos without sizes in plain text format:
-        $ python -m find_large vids -d /path/to/search -s 500 -n -nt
-        $ find-large vids -d /path/to/search -s 500 -n -nt
-    """
-    validate_directory(directory)
-    size_mb, size_unit = validate_size_options(size_gb, size_mb)
-    scanner = VideoScanner(directory, size_mb, output_file, size_unit, no_size, no_table, verbose)
-    scanner.run()
 
 
 def main() -> None:
@@ -0,0 +1,85 @@
+"""Columnar (Arrow IPC / Parquet) result output.
+
+Requires the optional ``pyarrow`` dependency (``pip install 'find-large[arrow]'``),
+which is only imported when a columnar output file is requested.
+"""
+
+import os
+
+COLUMNAR_EXTENSIONS: frozenset[str] = frozenset({".arrow", ".parquet"})
+BATCH_SIZE: int = 8192
+
+
+def is_columnar_output(output_file: str | None) -> bool:
+    """Check if results should be written in a columnar format.
+
+    Args:
+        output_file: Output file path, if any.
+
+    Returns:
+        bool: True if the file has an ``.arrow`` or ``.parquet`` extension.
+    """
+    return bool(output_file) and os.path.splitext(output_file)[1].lower() in COLUMNAR_EXTENSIONS
+
+
+class ColumnarWriter:
+    """Write (path, size) rows to an Arrow IPC stream or Parquet file in batches.
+
+    Rows are buffered in one list per column and converted to a record batch every
+    ``BATCH_SIZE`` rows.
+    """
+
+    def __init__(self, output_file: str, batch_size: int = BATCH_SIZE) -> None:
+        """Open the output file.
+
+        pyarrow is imported here, so an ``ImportError`` propagates if it is missing.
+
+        Args:
+            output_file: Path ending in ``.arrow`` or ``.parquet``.
+            batch_size: Number of rows per record batch.
+        """
+        import pyarrow as pa
+
+        self._pa = pa
+        self.batch_size = batch_size
+        self.schema = pa.schema([("path", pa.string()), ("size", pa.uint64())])
+        if output_file.lower().endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(output_file, self.schema)
+        else:
+            self._writer = pa.ipc.new_stream(output_file, self.schema)
+        self._paths: list[str] = []
+        self._sizes: list[int] = []
+
+    def write(self, item_path: str, size_bytes: int) -> None:
+        """Buffer a row, writing a batch once enough rows are collected.
+
+        Args:
+            item_path: Path of the item.
+            size_bytes: Size of the item in bytes.
+        """
+        self._paths.append(item_path)
+        self._sizes.append(size_bytes)
+        if len(self._paths) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows as one record batch."""
+        if not self._paths:
+            return
+        batch = self._pa.record_batch(
+            [
+                self._pa.array(self._paths, type=self._pa.string()),
+                self._pa.array(self._sizes, type=self._pa.uint64()),
+            ],
+            schema=self.schema,
+        )
+        self._writer.write_batch(batch)
+        self._paths = []
+        self._sizes = []
+
+    def close(self) -> None:
+        """Write any remaining rows and close the output file."""
+        self.flush()
+        self._writer.close()
@@ -3,10 +3,21 @@
 import os
 from typing import Final
 
+# Home directory, expanded once for the paths below
+_HOME: Final[str] = os.path.expanduser("~")
+
 # Default search parameters
 DEFAULT_DIR: Final[str] = "."
 DEFAULT_SIZE_GB: Final[float] = 1
 DEFAULT_SIZE_MB: Final[float] = 100
+DEFAULT_JOBS: Final[int] = 1
+
+# Persistent scan cache
+CACHE_DIR: Final[str] = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(_HOME, ".cache"), "find-large"
+)
+CACHE_FILE: Final[str] = os.path.join(CACHE_DIR, "sizes.sqlite")
+DEFAULT_CACHE_TTL: Final[float] = 24 * 60 * 60
 
 # Size conversion constants
 KB_TO_BYTES: Final[int] = 1024
@@ -15,10 +26,43 @@ GB_TO_BYTES: Final[int] = MB_TO_BYTES * 1024
 TB_TO_BYTES: Final[int] = GB_TO_BYTES * 1024
 
 # Hidden folders to include in search
-INCLUDE_HIDDEN_FOLDERS: Final[set[str]] = {".git", ".config", ".huggingface", ".local"}
+INCLUDE_HIDDEN_FOLDERS: Final[frozenset[str]] = frozenset({
+    ".git",
+    ".config",
+    ".huggingface",
+    ".local",
+})
+
+# File extensions (lowercase, with the leading dot) listed by the vids command
+VIDEO_EXTENSIONS: Final[frozenset[str]] = frozenset({
+    ".mp4",
+    ".mkv",
+    ".avi",
+    ".mov",
+    ".wmv",
+    ".flv",
+    ".webm",
+    ".m4v",
+    ".mpg",
+    ".mpeg",
+    ".3gp",
+    ".3g2",
+    ".m2ts",
+    ".mts",
+    ".ts",
+    ".vob",
+    ".ogv",
+    ".rm",
+    ".rmvb",
+    ".asf",
+    ".divx",
+})
+
+# Linux pseudo-filesystems that never hold user data
+PSEUDO_FILESYSTEM_DIRS: Final[frozenset[str]] = frozenset({"/proc", "/sys", "/dev", "/run"})
 
 # System folders to exclude from search
-EXCLUDE_FOLDERS: Final[list[str]] = [
+_SYSTEM_EXCLUDE_FOLDERS: Final[tuple[str, ...]] = (
     # System directories
     "/System",
     "/private",
@@ -26,125 +70,133 @@ EXCLUDE_FOLDERS: Final[list[str]] = [
     "/Library/Extensions",
     "/System/Library/PrivateFrameworks",
     "/Library/Kexts/",
+)
+
+# User folders to exclude from search, relative to the home directory
+_USER_EXCLUDE_FOLDERS: Final[tuple[str, ...]] = (
     # User Library directories
-    os.path.expanduser("~/Library/Mail"),
-    os.path.expanduser("~/Library/Messages"),
-    os.path.expanduser("~/Library/Safari"),
-    os.path.expanduser("~/Library/Calendars"),
-    os.path.expanduser("~/Library/Keychains"),
-    os.path.expanduser("~/Library/Containers/com.apple.notes"),
-    os.path.expanduser("~/Library/Application Support/AddressBook"),
-    os.path.expanduser("~/Library/Application Support/MobileSync"),
-    os.path.expanduser("~/Library/Application Support/CallHistoryTransactions"),
-    os.path.expanduser("~/Library/Application Support/CloudDocs"),
-    os.path.expanduser("~/Library/Application Support/com.apple.sharedfilelist"),
-    os.path.expanduser("~/Library/Application Support/Knowledge"),
-    os.path.expanduser("~/Library/Application Support/com.apple.TCC"),
-    os.path.expanduser("~/Library/Application Support/FileProvider"),
-    os.path.expanduser("~/Library/Application Support/FaceTime"),
-    os.path.expanduser("~/Library/Application Support/com.apple.avfoundation/Frecents"),
-    os.path.expanduser("~/Library/Application Support/CallHistoryDB"),
+    "Library/Mail",
+    "Library/Messages",
+    "Library/Safari",
+    "Library/Calendars",
+    "Library/Keychains",
+    "Library/Containers/com.apple.notes",
+    "Library/Application Support/AddressBook",
+    "Library/Application Support/MobileSync",
+    "Library/Application Support/CallHistoryTransactions",
+    "Library/Application Support/CloudDocs",
+    "Library/Application Support/com.apple.sharedfilelist",
+    "Library/Application Support/Knowledge",
+    "Library/Application Support/com.apple.TCC",
+    "Library/Application Support/FileProvider",
+    "Library/Application Support/FaceTime",
+    "Library/Application Support/com.apple.avfoundation/Frecents",
+    "Library/Application Support/CallHistoryDB",
     # Additional Library directories
-    os.path.expanduser("~/Library/Assistant/SiriVocabulary"),
-    os.path.expanduser("~/Library/Daemon Containers"),
-    os.path.expanduser("~/Library/Autosave Information"),
-    os.path.expanduser("~/Library/IdentityServices"),
-    os.path.expanduser("~/Library/HomeKit"),
-    os.path.expanduser("~/Library/Sharing"),
-    os.path.expanduser("~/Library/com.apple.aiml.instrumentation"),
-    os.path.expanduser("~/Library/Trial"),
-    os.path.expanduser("~/Library/AppleMediaServices"),
-    os.path.expanduser("~/Library/DuetExpertCenter"),
-    os.path.expanduser("~/Library/Accounts"),
-    os.path.expanduser("~/Library/Biome"),
-    os.path.expanduser("~/Library/IntelligencePlatform"),
-    os.path.expanduser("~/Library/Shortcuts"),
-    os.path.expanduser("~/Library/Suggestions"),
-    os.path.expanduser("~/Library/Weather"),
+    "Library/Assistant/SiriVocabulary",
+    "Library/Daemon Containers",
+    "Library/Autosave Information",
+    "Library/IdentityServices",
+    "Library/HomeKit",
+    "Library/Sharing",
+    "Library/com.apple.aiml.instrumentation",
+    "Library/Trial",
+    "Library/AppleMediaServices",
+    "Library/DuetExpertCenter",
+    "Library/Accounts",
+    "Library/Biome",
+    "Library/IntelligencePlatform",
+    "Library/Shortcuts",
+    "Library/Suggestions",
+    "Library/Weather",
     # Group Containers
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.stocks-news"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.photolibraryd.private"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.accessibility.voicebanking"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.stocks"),
-    os.path.expanduser(
-        "~/Library/Group Containers/group.com.apple.secure-control-center-preferences"
-    ),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.chronod"),
-    os.path.expanduser("~/Library/Group Containers/com.apple.MailPersonaStorage"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.private.translation"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.calendar"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.newsd"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.ip.redirects"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.siri.userfeedbacklearning"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.gamecenter"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.tips"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.tv.sharedcontainer"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.ManagedSettings"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.sharingd"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.weather"),
-    os.path.expanduser("~/Library/Group Containers/com.apple.systempreferences.cache"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.feedbacklogger"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.notes"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.tipsnext"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.Safari.SandboxBroker"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.transparency"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.reminders"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.mail"),
-    os.path.expanduser("~/Library/Group Containers/com.apple.bird"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.DeviceActivity"),
-    os.path.expanduser("~/Library/Group Containers/com.apple.Home.group"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.iCloudDrive"),
-    os.path.expanduser("~/Library/Group Containers/com.apple.PreviewLegacySignaturesConversion"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.AppleSpell"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.mlhost"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.PegasusConfiguration"),
-    os.path.expanduser("~/Library/Group Containers/group.com.apple.shortcuts"),
-    os.path.expanduser("~/Library/Group Containers/com.apple.MessagesLegacyTransferArchive"),
+    "Library/Group Containers/group.com.apple.stocks-news",
+    "Library/Group Containers/group.com.apple.photolibraryd.private",
+    "Library/Group Containers/group.com.apple.accessibility.voicebanking",
+    "Library/Group Containers/group.com.apple.stocks",
+    "Library/Group Containers/group.com.apple.secure-control-center-preferences",
+    "Library/Group Containers/group.com.apple.chronod",
+    "Library/Group Containers/com.apple.MailPersonaStorage",
+    "Library/Group Containers/group.com.apple.private.translation",
+    "Library/Group Containers/group.com.apple.calendar",
+    "Library/Group Containers/group.com.apple.newsd",
+    "Library/Group Containers/group.com.apple.ip.redirects",
+    "Library/Group Containers/group.com.apple.siri.userfeedbacklearning",
+    "Library/Group Containers/group.com.apple.gamecenter",
+    "Library/Group Containers/group.com.apple.tips",
+    "Library/Group Containers/group.com.apple.tv.sharedcontainer",
+    "Library/Group Containers/group.com.apple.ManagedSettings",
+    "Library/Group Containers/group.com.apple.sharingd",
+    "Library/Group Containers/group.com.apple.weather",
+    "Library/Group Containers/com.apple.systempreferences.cache",
+    "Library/Group Containers/group.com.apple.feedbacklogger",
+    "Library/Group Containers/group.com.apple.notes",
+    "Library/Group Containers/group.com.apple.tipsnext",
+    "Library/Group Containers/group.com.apple.Safari.SandboxBroker",
+    "Library/Group Containers/group.com.apple.transparency",
+    "Library/Group Containers/group.com.apple.reminders",
+    "Library/Group Containers/group.com.apple.mail",
+    "Library/Group Containers/com.apple.bird",
+    "Library/Group Containers/group.com.apple.DeviceActivity",
+    "Library/Group Containers/com.apple.Home.group",
+    "Library/Group Containers/group.com.apple.iCloudDrive",
+    "Library/Group Containers/com.apple.PreviewLegacySignaturesConversion",
+    "Library/Group Containers/group.com.apple.AppleSpell",
+    "Library/Group Containers/group.com.apple.mlhost",
+    "Library/Group Containers/group.com.apple.PegasusConfiguration",
+    "Library/Group Containers/group.com.apple.shortcuts",
+    "Library/Group Containers/com.apple.MessagesLegacyTransferArchive",
     # Containers
-    os.path.expanduser("~/Library/Containers/com.apple.VoiceMemos"),
-    os.path.expanduser("~/Library/Containers/com.apple.archiveutility"),
-    os.path.expanduser("~/Library/Containers/com.apple.Maps/Data/Maps"),
-    os.path.expanduser("~/Library/Containers/com.apple.Home"),
-    os.path.expanduser("~/Library/Containers/com.apple.Safari"),
-    os.path.expanduser("~/Library/Containers/com.apple.CloudDocs.MobileDocumentsFileProvider"),
-    os.path.expanduser("~/Library/Containers/com.apple.mail"),
-    os.path.expanduser("~/Library/Containers/com.apple.MobileSMS"),
-    os.path.expanduser("~/Library/Containers/com.apple.Notes"),
-    os.path.expanduser("~/Library/Containers/com.apple.news"),
-    os.path.expanduser("~/Library/Containers/com.apple.corerecents.recentsd/Data/Library/Recents"),
-    os.path.expanduser("~/Library/Containers/com.apple.stocks"),
-    os.path.expanduser("~/Library/Containers/com.apple.Safari.WebApp"),
+    "Library/Containers/com.apple.VoiceMemos",
+    "Library/Containers/com.apple.archiveutility",
+    "Library/Containers/com.apple.Maps/Data/Maps",
+    "Library/Containers/com.apple.Home",
+    "Library/Containers/com.apple.Safari",
+    "Library/Containers/com.apple.CloudDocs.MobileDocumentsFileProvider",
+    "Library/Containers/com.apple.mail",
+    "Library/Containers/com.apple.MobileSMS",
+    "Library/Containers/com.apple.Notes",
+    "Library/Containers/com.apple.news",
+    "Library/Containers/com.apple.corerecents.recentsd/Data/Library/Recents",
+    "Library/Containers/com.apple.stocks",
+    "Library/Containers/com.apple.Safari.WebApp",
     # Additional system directories
-    os.path.expanduser("~/Library/ContainerManager"),
-    os.path.expanduser("~/Library/PersonalizationPortrait"),
-    os.path.expanduser("~/Library/Photos/Libraries/Syndication.photoslibrary"),
-    os.path.expanduser("~/Library/Metadata/CoreSpotlight"),
-    os.path.expanduser("~/Library/Metadata/com.apple.IntelligentSuggestions"),
-    os.path.expanduser("~/Library/Cookies"),
-    os.path.expanduser("~/Library/CoreFollowUp"),
-    os.path.expanduser("~/Library/StatusKit"),
-    os.path.expanduser("~/Library/DoNotDisturb"),
+    "Library/ContainerManager",
+    "Library/PersonalizationPortrait",
+    "Library/Photos/Libraries/Syndication.photoslibrary",
+    "Library/Metadata/CoreSpotlight",
+    "Library/Metadata/com.apple.IntelligentSuggestions",
+    "Library/Cookies",
+    "Library/CoreFollowUp",
+    "Library/StatusKit",
+    "Library/DoNotDisturb",
     # Cache directories
-    os.path.expanduser("~/Library/Caches/com.apple.HomeKit"),
-    os.path.expanduser("~/Library/Caches/CloudKit"),
-    os.path.expanduser("~/Library/Caches/com.apple.Safari"),
-    os.path.expanduser("~/Library/Caches/com.apple.findmy.imagecache"),
-    os.path.expanduser("~/Library/Caches/com.apple.findmy.fmfcore"),
-    os.path.expanduser("~/Library/Caches/com.apple.containermanagerd"),
-    os.path.expanduser("~/Library/Caches/FamilyCircle"),
-    os.path.expanduser("~/Library/Caches/com.apple.homed"),
-    os.path.expanduser("~/Library/Caches/com.apple.findmy.fmipcore"),
-    os.path.expanduser("~/Library/Caches/com.apple.ap.adprivacyd"),
+    "Library/Caches/com.apple.HomeKit",
+    "Library/Caches/CloudKit",
+    "Library/Caches/com.apple.Safari",
+    "Library/Caches/com.apple.findmy.imagecache",
+    "Library/Caches/com.apple.findmy.fmfcore",
+    "Library/Caches/com.apple.containermanagerd",
+    "Library/Caches/FamilyCircle",
+    "Library/Caches/com.apple.homed",
+    "Library/Caches/com.apple.findmy.fmipcore",
+    "Library/Caches/com.apple.ap.adprivacyd",
     # Other
-    os.path.expanduser("~/.Trash"),
-    os.path.expanduser("~/Pictures/Photos Library.photoslibrary"),
-    os.path.expanduser("~/Dropbox"),
-    os.path.expanduser("~/Library/CloudStorage/Dropbox"),
-    os.path.expanduser("~/Library/Containers/com.apple.CloudPhotosConfiguration"),
-    os.path.expanduser(
-        "~/Library/Containers/com.apple.dp.PrivateFederatedLearning.DPMLRuntimePluginClassB/"
-    ),
+    ".Trash",
+    "Pictures/Photos Library.photoslibrary",
+    "Dropbox",
+    "Library/CloudStorage/Dropbox",
+    "Library/Containers/com.apple.CloudPhotosConfiguration",
+    "Library/Containers/com.apple.dp.PrivateFederatedLearning.DPMLRuntimePluginClassB/",
+)
+
+EXCLUDE_FOLDERS: Final[list[str]] = [
+    *_SYSTEM_EXCLUDE_FOLDERS,
+    *(os.path.join(_HOME, folder) for folder in _USER_EXCLUDE_FOLDERS),
 ]
+EXCLUDE_FOLDERS_ABS: Final[frozenset[str]] = frozenset(
+    os.path.abspath(folder) for folder in EXCLUDE_FOLDERS
+)
 
 # Size units for display
 SIZE_UNIT_GB: Final[str] = "GB"
@@ -1,26 +1,109 @@
 """Core functionality for finding large items."""
 
+import heapq
 import logging
 import os
 import sys
+from array import array
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 
 from find_large import formatting
+from find_large.columnar import is_columnar_output
 from find_large.constants import (
-    EXCLUDE_FOLDERS,
+    EXCLUDE_FOLDERS_ABS,
     GB_TO_BYTES,
     INCLUDE_HIDDEN_FOLDERS,
     MB_TO_BYTES,
+    PSEUDO_FILESYSTEM_DIRS,
     SIZE_UNIT_GB,
     SIZE_UNIT_MB,
 )
 
+if TYPE_CHECKING:
+    from find_large.cache import ScanCache
+    from find_large.columnar import ColumnarWriter
+
+logger = logging.getLogger(__name__)
+
+# Listing directories through a file descriptor lets DirEntry.stat() use fstatat()
+# relative to it instead of resolving the full path again for every entry.
+SCANDIR_ACCEPTS_FD: bool = os.scandir in os.supports_fd
+DIR_OPEN_FLAGS: int = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+# Result files are written through a large buffer to keep write() calls few
+OUTPUT_BUFFER_SIZE: int = 1 << 20
+
+# Marks the end of an excluded path in a path trie; real components are never empty
+_TRIE_END: str = ""
+
+
+def build_path_trie(paths: Iterable[str]) -> dict[str, Any]:
+    """Build a trie of path components.
+
+    Args:
+        paths: Absolute paths to insert.
+
+    Returns:
+        dict[str, Any]: Nested dicts keyed by path component.
+    """
+    trie: dict[str, Any] = {}
+    for path in paths:
+        add_to_path_trie(trie, path)
+    return trie
+
+
+def add_to_path_trie(trie: dict[str, Any], path: str) -> None:
+    """Insert a path into a trie built by ``build_path_trie``.
+
+    Args:
+        trie: Trie to update in place.
+        path: Absolute path to insert.
+    """
+    node = trie
+    for part in path.split(os.sep):
+        if part:
+            node = node.setdefault(part, {})
+    node[_TRIE_END] = {}
+
+
+def path_trie_matches(trie: dict[str, Any], path: str) -> bool:
+    """Check if a path equals, or lies below, any path in a trie.
+
+    Args:
+        trie: Trie built by ``build_path_trie``.
+        path: Absolute path to check.
+
+    Returns:
+        bool: True if the path or one of its ancestors is in the trie.
+    """
+    node = trie
+    if _TRIE_END in node:
+        return True
+    for part in path.split(os.sep):
+        if not part:
+            continue
+        node = node.get(part)
+        if node is None:
+            return False
+        if _TRIE_END in node:
+            return True
+    return False
+
+
+DEFAULT_EXCLUDE_TRIE: dict[str, Any] = build_path_trie(EXCLUDE_FOLDERS_ABS)
+
 
 class SizeScannerBase:
     """Base class for scanning items by size."""
 
+    # Whether plain-text results may be written to the output file while scanning
+    streams_results: bool = False
+
     def __init__(
         self,
         search_dir: str | Path,
@@ -30,6 +113,10 @@ class SizeScannerBase:
         no_size: bool = False,
         no_table: bool = False,
         verbose: bool = False,
+        jobs: int = 1,
+        cache: "ScanCache | None" = None,
+        one_file_system: bool = False,
+        top: int | None = None,
     ) -> None:
         """Initialize the scanner."""
         self.search_dir = str(search_dir)
@@ -39,12 +126,103 @@ class SizeScannerBase:
         self.no_size = no_size
         self.no_table = no_table
         self.verbose = verbose
+        self.jobs = max(1, jobs)
+        self.cache = cache
+        self.one_file_system = one_file_system
+        self.top = top
+        # When set, items are held back and recorded largest first after the scan
+        self.largest_first = False
+        # (size, -order found, path) of the items held back until finish_top_items.
+        # While ``top`` is set this is a min-heap of the largest items; on equal
+        # sizes the item found last is dropped first
+        self._top_items: list[tuple[int, int, str]] = []
+        self.root_dev: int | None = None
+        # When set, stop sizing a directory's files once they add up to this many
+        # bytes; only used by scanners that need no more than a lower bound
+        self.listing_size_limit: int | None = None
         self.size_bytes_threshold = int(size_mb * MB_TO_BYTES)
-        self.items_list: list[tuple[str, int]] = []
+        # Found items are kept as parallel columns: a list of paths and a packed
+        # int64 array of sizes, instead of one tuple and int object per item.
+        self._item_paths: list[str] = []
+        self._item_sizes: array[int] = array("q")
         self.total_bytes: int = 0
-        self.exclude_folders_abs = [os.path.abspath(folder) for folder in EXCLUDE_FOLDERS]
+        self.items_found: int = 0
+        self._output_console: Console | None = None
+        self._columnar_writer: ColumnarWriter | None = None
+        # The default excludes never change, so every scanner shares one trie
+        self._exclude_folders_abs: Collection[str] = EXCLUDE_FOLDERS_ABS
+        self._exclude_trie = DEFAULT_EXCLUDE_TRIE
+        # Pseudo-filesystems are only scanned when asked for explicitly
+        if sys.platform.startswith("linux"):
+            self.skip_paths = PSEUDO_FILESYSTEM_DIRS - {os.path.abspath(self.search_dir)}
+        else:
+            self.skip_paths = frozenset()
         self.setup_logging()
 
+    @property
+    def size_unit(self) -> str:
+        """Unit used to display sizes."""
+        return self._size_unit
+
+    @size_unit.setter
+    def size_unit(self, size_unit: str) -> None:
+        self._size_unit = size_unit
+        # The unit is fixed for a scan, so resolve the divisor once, not per row
+        if size_unit == SIZE_UNIT_GB:
+            self._size_divisor = GB_TO_BYTES
+            self._size_label = SIZE_UNIT_GB
+        else:
+            self._size_divisor = MB_TO_BYTES
+            self._size_label = SIZE_UNIT_MB
+
+    @property
+    def items_list(self) -> tuple[tuple[str, int], ...]:
+        """(path, size) pairs of the items found, as a read-only snapshot.
+
+        The items are stored as columns, so this is built on every access and has no
+        ``append`` or ``sort``. Assign a new sequence to replace the items instead.
+        Items held back for ``top`` or ``largest_first`` only appear once
+        ``finish_top_items`` has run.
+        """
+        return tuple(zip(self._item_paths, self._item_sizes, strict=True))
+
+    @items_list.setter
+    def items_list(self, items: Iterable[tuple[str, int]]) -> None:
+        self._item_paths = []
+        self._item_sizes = array("q")
+        for item_path, size_bytes in items:
+            self._item_paths.append(item_path)
+            self._item_sizes.append(size_bytes)
+
+    @property
+    def exclude_folders_abs(self) -> Collection[str]:
+        """Absolute paths of the folders excluded from the search."""
+        return self._exclude_folders_abs
+
+    @exclude_folders_abs.setter
+    def exclude_folders_abs(self, folders: Collection[str]) -> None:
+        self._exclude_folders_abs = folders
+        self._exclude_trie = build_path_trie(folders)
+
+    def __enter__(self) -> "SizeScannerBase":
+        """Return the scanner for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the output file when leaving a ``with`` block."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the streamed output file if it is open."""
+        if self._columnar_writer is not None:
+            self._columnar_writer.close()
+            self._columnar_writer = None
+        if self._output_console is not None:
+            # Without an output file the rows went to the shared terminal console
+            if self.output_file:
+                self._output_console.file.close()
+            self._output_console = None
+
     def setup_logging(self) -> None:
         """Configure logging based on verbosity level."""
         log_level = logging.DEBUG if self.verbose else logging.INFO
@@ -65,17 +243,251 @@ class SizeScannerBase:
             bool: True if path should be skipped, False otherwise.
         """
         basename = os.path.basename(path)
-        if basename.startswith(".") and basename not in INCLUDE_HIDDEN_FOLDERS:
+        if basename[:1] == "." and basename not in INCLUDE_HIDDEN_FOLDERS:
             return True
 
-        abs_path = os.path.abspath(path)
-        for exclude_path in self.exclude_folders_abs:
-            if abs_path.startswith(exclude_path):
-                if self.verbose:
-                    logging.debug(f"Skipping excluded path: {abs_path}")
-                return True
+        if path in self.skip_paths:
+            if self.verbose:
+                logger.debug("Skipping pseudo-filesystem: %s", path)
+            return True
+
+        # The walk builds paths by joining entry names onto the search directory, so
+        # below an absolute search directory they need no further normalisation
+        abs_path = path if os.path.isabs(path) else os.path.abspath(path)
+        if path_trie_matches(self._exclude_trie, abs_path):
+            if self.verbose:
+                logger.debug("Skipping excluded path: %s", abs_path)
+            return True
         return False
 
+    def include_file(self, name: str) -> bool:
+        """Check if a file should be considered by the scanner.
+
+        Args:
+            name: Base name of the file.
+
+        Returns:
+            bool: True if the file should be sized, False otherwise.
+        """
+        return True
+
+    def scan_directory(self, root: str) -> tuple[list[tuple[str, int]], list[str]] | None:
+        """List a single directory, reusing a cached listing when one is valid.
+
+        Args:
+            root: Directory to list.
+
+        Returns:
+            tuple[list[tuple[str, int]], list[str]] | None: The (path, size) pairs of the
+                included files and the paths of the subdirectories, or None if the
+                directory could not be read.
+        """
+        if self.verbose:
+            logger.debug("Scanning directory: %s", root)
+
+        # Scanners that keep the default include_file size every file, so the
+        # per-file predicate call can be skipped for them
+        include = (
+            None if type(self).include_file is SizeScannerBase.include_file else self.include_file
+        )
+        if self.cache is None:
+            return self._list_directory(root, include, self.listing_size_limit)
+
+        try:
+            st = os.stat(root)
+        except OSError as e:
+            if self.verbose:
+                logger.debug("Could not access directory %s: %s", root, e)
+            return None
+        if self.is_other_device(root, st.st_dev):
+            return None
+        mtime_ns, dev, ino = st.st_mtime_ns, st.st_dev, st.st_ino
+
+        listing = self.cache.get(root, mtime_ns, dev, ino)
+        if listing is None:
+            # Cache every file, fully sized, so the listing can be shared by all scanners
+            listing = self._list_directory(root, None)
+            if listing is None:
+                return None
+            self.cache.put(root, mtime_ns, *listing, dev=dev, ino=ino)
+        elif self.verbose:
+            logger.debug("Using cached listing for %s", root)
+
+        files, subdirs = listing
+        if include is None:
+            return files, subdirs
+        start = len(os.path.join(root, ""))
+        return [item for item in files if include(item[0][start:])], subdirs
+
+    def _list_directory(
+        self, root: str, include: Callable[[str], bool] | None, size_limit: int | None = None
+    ) -> tuple[list[tuple[str, int]], list[str]] | None:
+        """List a single directory using os.scandir.
+
+        Hidden entries are ignored. File sizes are read from the cached ``DirEntry``
+        data, and where supported the directory is listed through a file descriptor
+        so each stat is resolved relative to it.
+
+        Args:
+            root: Directory to list.
+            include: Predicate on file names selecting which files to size, or None
+                to size every file.
+            size_limit: Stop sizing files once their sizes add up to this many bytes,
+                leaving the remaining files out of the listing. None sizes every file.
+
+        Returns:
+            tuple[list[tuple[str, int]], list[str]] | None: The (path, size) pairs of the
+                included files and the paths of the subdirectories, or None if the
+                directory could not be read.
+        """
+        files: list[tuple[str, int]] = []
+        subdirs: list[str] = []
+        append_file = files.append
+        append_subdir = subdirs.append
+        hidden_dirs = 0
+        listed_bytes = 0
+        if size_limit is None:
+            size_limit = sys.maxsize
+        prefix = os.path.join(root, "")
+        dir_fd: int | None = None
+        try:
+            if SCANDIR_ACCEPTS_FD:
+                dir_fd = os.open(root, DIR_OPEN_FLAGS)
+            if self.root_dev is not None:
+                st_dev = (os.stat(root) if dir_fd is None else os.fstat(dir_fd)).st_dev
+                if self.is_other_device(root, st_dev):
+                    return None
+            with os.scandir(root if dir_fd is None else dir_fd) as entries:
+                for entry in entries:
+                    name = entry.name
+                    path = prefix + name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name[:1] == ".":
+                                hidden_dirs += 1
+                            else:
+                                append_subdir(path)
+                        elif (
+                            entry.is_file(follow_symlinks=False)
+                            and name[:1] != "."
+                            and (include is None or include(name))
+                        ):
+                            if listed_bytes >= size_limit:
+                                continue
+                            size_bytes = entry.stat(follow_symlinks=False).st_size
+                            listed_bytes += size_bytes
+                            append_file((path, size_bytes))
+                    except OSError as e:
+                        if self.verbose:
+                            logger.debug("Could not access file %s: %s", path, e)
+                        continue
+        except OSError as e:
+            if self.verbose:
+                logger.debug("Could not access directory %s: %s", root, e)
+            return None
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+        if self.verbose and hidden_dirs:
+            logger.debug("Filtered out %d hidden directories", hidden_dirs)
+
+        return files, subdirs
+
+    def is_other_device(self, root: str, st_dev: int) -> bool:
+        """Check if a directory lies on another filesystem than the search directory.
+
+        Always False unless ``one_file_system`` is enabled.
+
+        Args:
+            root: Directory being scanned.
+            st_dev: Device number of the directory.
+
+        Returns:
+            bool: True if the directory is a mount point that should not be crossed.
+        """
+        if self.root_dev is None or st_dev == self.root_dev:
+            return False
+        if self.verbose:
+            logger.debug("Skipping mount point: %s", root)
+        return True
+
+    def walk(self) -> Iterator[tuple[str, list[tuple[str, int]]]]:
+        """Walk the search directory, skipping hidden and excluded directories.
+
+        With one job, directories are yielded depth first in the order ``os.walk``
+        visits them. With more than one, they are listed concurrently by a thread pool
+        so that the latency of the underlying syscalls overlaps, and the order depends
+        on which listing finishes first. Either way, every directory is yielded before
+        any of its subdirectories.
+
+        Yields:
+            tuple[str, list[tuple[str, int]]]: Directory path and the (path, size)
+                pairs of the included files directly inside it.
+        """
+        if self.one_file_system:
+            try:
+                self.root_dev = os.stat(self.search_dir).st_dev
+            except OSError:
+                self.root_dev = None
+
+        if self.jobs > 1:
+            yield from self._walk_parallel()
+            return
+
+        if self.should_skip_path(self.search_dir):
+            return
+
+        stack = [self.search_dir]
+        while stack:
+            root = stack.pop()
+            result = self.scan_directory(root)
+            if result is None:
+                continue
+            files, subdirs = result
+            # Prune excluded directories before they are queued, pushing them in
+            # reverse so they are popped in listing order, as os.walk visits them
+            stack.extend(
+                subdir for subdir in reversed(subdirs) if not self.should_skip_path(subdir)
+            )
+            yield root, files
+
+    def _walk_parallel(self) -> Iterator[tuple[str, list[tuple[str, int]]]]:
+        """Walk the search directory with a pool of ``self.jobs`` threads.
+
+        At most ``2 * self.jobs`` directories are in flight at once; the rest wait on
+        a depth-first stack so the number of queued futures stays bounded on wide trees.
+
+        Yields:
+            tuple[str, list[tuple[str, int]]]: Directory path and the (path, size)
+                pairs of the included files directly inside it.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        pending: dict[Future[tuple[list[tuple[str, int]], list[str]] | None], str] = {}
+        stack: list[str] = []
+        max_pending = self.jobs * 2
+        try:
+            if not self.should_skip_path(self.search_dir):
+                stack.append(self.search_dir)
+
+            while stack or pending:
+                while stack and len(pending) < max_pending:
+                    root = stack.pop()
+                    pending[executor.submit(self.scan_directory, root)] = root
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    root = pending.pop(future)
+                    result = future.result()
+                    if result is None:
+                        continue
+                    files, subdirs = result
+                    # Prune excluded directories before they are queued
+                    stack.extend(subdir for subdir in subdirs if not self.should_skip_path(subdir))
+                    yield root, files
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def format_size(self, size_bytes: int) -> str:
         """Format size in appropriate units.
 
@@ -85,25 +497,19 @@ class SizeScannerBase:
         Returns:
             str: Formatted size string with unit.
         """
-        if self.size_unit == SIZE_UNIT_GB:
-            size = size_bytes / GB_TO_BYTES
-            size_label = SIZE_UNIT_GB
-        else:
-            size = size_bytes / MB_TO_BYTES
-            size_label = SIZE_UNIT_MB
-        return f"{size:.2f} {size_label}"
+        return f"{size_bytes / self._size_divisor:.2f} {self._size_label}"
 
     def save_results(self, data_lines: list[tuple[str, ...]]) -> None:
         """Save results to file if output file is specified."""
         if self.output_file:
             try:
-                file_console: Console = formatting.Console(
-                    file=open(self.output_file, "w"), force_terminal=True
-                )
-                formatting.format_table(
-                    data_lines, self.no_size, self.total_bytes, file_console, self.no_table
-                )
-                file_console.file.close()
+                with open(
+                    self.output_file, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE
+                ) as output:
+                    file_console: Console = formatting.Console(file=output, force_terminal=True)
+                    formatting.format_table(
+                        data_lines, self.no_size, self.total_bytes, file_console, self.no_table
+                    )
                 formatting.print_success(f"Results saved to {self.output_file}")
             except Exception as e:
                 self.error_exit(f"An error occurred while writing to the output file: {e}")
@@ -112,6 +518,90 @@ class SizeScannerBase:
                 data_lines, self.no_size, self.total_bytes, no_table=self.no_table
             )
 
+    def add_item(self, item_path: str, size_bytes: int) -> None:
+        """Record an item that meets the size threshold.
+
+        While streaming (plain-text or columnar output), the row is written to the
+        output file straight away instead of being kept in ``items_list``. With
+        ``top`` set, only the largest items are kept until ``finish_top_items``;
+        with ``largest_first`` set, every item is.
+
+        Args:
+            item_path: Path of the item.
+            size_bytes: Size of the item in bytes.
+        """
+        self.items_found += 1
+        if self.top is not None:
+            item = (size_bytes, -self.items_found, item_path)
+            if len(self._top_items) < self.top:
+                heapq.heappush(self._top_items, item)
+            else:
+                heapq.heappushpop(self._top_items, item)
+        elif self.largest_first:
+            self._top_items.append((size_bytes, -self.items_found, item_path))
+        else:
+            self._record_item(item_path, size_bytes)
+
+    def finish_top_items(self) -> None:
+        """Record the items held back for ``top`` or ``largest_first``, largest first.
+
+        Equal sizes keep the order they were found in, so a directory comes before
+        a subdirectory of the same size. Does nothing unless one of them is set.
+
+        ``run`` calls this after ``scan``; code calling ``scan`` directly must call it
+        too. The held-back items are recorded once, so calling it again is a no-op.
+        """
+        top_items = sorted(self._top_items, reverse=True)
+        self._top_items = []
+        for size_bytes, _, item_path in top_items:
+            self._record_item(item_path, size_bytes)
+
+    def _record_item(self, item_path: str, size_bytes: int) -> None:
+        """Write an item to the open output stream or keep it for the results table.
+
+        Args:
+            item_path: Path of the item.
+            size_bytes: Size of the item in bytes.
+        """
+        self.total_bytes += self.counted_size(item_path, size_bytes)
+        if self._columnar_writer is not None:
+            self._columnar_writer.write(item_path, size_bytes)
+        elif self._output_console is not None:
+            row = self.format_row(item_path, size_bytes)
+            if self.output_file:
+                formatting.write_plain_row(self._output_console.file, row, self.no_size)
+            else:
+                formatting.print_plain_row(self._output_console, row, self.no_size)
+        else:
+            self._item_paths.append(item_path)
+            self._item_sizes.append(size_bytes)
+
+    def counted_size(self, item_path: str, size_bytes: int) -> int:
+        """Return how much a recorded item adds to ``total_bytes``.
+
+        Args:
+            item_path: Path of the item.
+            size_bytes: Size of the item in bytes.
+
+        Returns:
+            int: The size of the item; subclasses whose items overlap return less.
+        """
+        return size_bytes
+
+    def format_row(self, item_path: str, size_bytes: int) -> tuple[str, ...]:
+        """Format a single result row.
+
+        Args:
+            item_path: Path of the item.
+            size_bytes: Size of the item in bytes.
+
+        Returns:
+            tuple[str, ...]: The row, without the size column when ``no_size`` is set.
+        """
+        if self.no_size:
+            return (item_path,)
+        return (item_path, self.format_size(size_bytes))
+
     def format_results(self) -> list[tuple[str, ...]]:
         """Format results for display.
 
@@ -120,36 +610,91 @@ class SizeScannerBase:
         """
         if self.no_size:
             data_lines: list[tuple[str, ...]] = [("Location",)]
+            data_lines.extend((item_path,) for item_path in self._item_paths)
         else:
             data_lines = [("Location", "Size")]
-
-        for item_path, size_bytes in self.items_list:
-            if self.no_size:
-                data_lines.append((item_path,))
-            else:
-                size_formatted = self.format_size(size_bytes)
-                data_lines.append((item_path, size_formatted))
+            format_size = self.format_size
+            data_lines.extend(
+                (item_path, format_size(size_bytes))
+                for item_path, size_bytes in zip(self._item_paths, self._item_sizes, strict=True)
+            )
 
         return data_lines
 
+    def open_output_stream(self) -> None:
+        """Open the output file so plain-text rows can be written as they are found.
+
+        Without an output file, rows are printed to the terminal as they are found.
+        """
+        if not self.output_file:
+            self._output_console = formatting.console
+            return
+        try:
+            self._output_console = formatting.Console(
+                file=open(self.output_file, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE),
+                force_terminal=True,
+            )
+        except Exception as e:
+            self.error_exit(f"An error occurred while writing to the output file: {e}")
+
+    def open_columnar_output(self) -> None:
+        """Open an Arrow IPC or Parquet writer for the output file."""
+        from find_large.columnar import ColumnarWriter
+
+        try:
+            self._columnar_writer = ColumnarWriter(self.output_file)
+        except ImportError:
+            self.error_exit(
+                f"Writing {os.path.splitext(self.output_file)[1]} output requires pyarrow "
+                "(pip install 'find-large[arrow]')."
+            )
+        except Exception as e:
+            self.error_exit(f"An error occurred while writing to the output file: {e}")
+
+    def finish_output_stream(self) -> None:
+        """Write the summary to the streamed output file and close it."""
+        try:
+            if self._output_console is not None:
+                formatting.print_plain_summary(self._output_console, self.total_bytes, self.no_size)
+            self.close()
+            if self.output_file:
+                formatting.print_success(f"Results saved to {self.output_file}")
+        except Exception as e:
+            self.error_exit(f"An error occurred while writing to the output file: {e}")
+
     def scan(self) -> None:
-        """Scan for items. Must be implemented by subclasses."""
+        """Scan for items. Must be implemented by subclasses.
+
+        Items are reported through ``add_item``. With ``top`` or ``largest_first``
+        set they are held back until ``finish_top_items`` is called.
+        """
         raise NotImplementedError("Subclasses must implement scan()")
 
     def run(self) -> None:
         """Run the scanner and display results."""
         if self.verbose:
-            logging.debug(f"Starting search in directory: {self.search_dir}")
-            logging.debug(f"Size threshold: {self.size_mb} MB ({self.size_bytes_threshold} bytes)")
-            logging.debug(f"Excluded folders: {len(EXCLUDE_FOLDERS)}")
+            logger.debug("Starting search in directory: %s", self.search_dir)
+            logger.debug(
+                "Size threshold: %s MB (%d bytes)", self.size_mb, self.size_bytes_threshold
+            )
+            logger.debug("Excluded folders: %d", len(self.exclude_folders_abs))
+
+        if is_columnar_output(self.output_file):
+            self.open_columnar_output()
+        elif self.streams_results and self.no_table:
+            self.open_output_stream()
 
         try:
             self.scan()
+            self.finish_top_items()
             if self.verbose:
-                logging.debug(
-                    f"Search completed. Found {len(self.items_list)} items matching criteria."
+                logger.debug(
+                    "Search completed. Found %d items matching criteria.", self.items_found
                 )
-            data_lines = self.format_results()
-            self.save_results(data_lines)
+            if self._output_console is not None or self._columnar_writer is not None:
+                self.finish_output_stream()
+            else:
+                data_lines = self.format_results()
+                self.save_results(data_lines)
         except Exception as e:
             self.error_exit(f"An error occurred during search: {e}")
@@ -67,7 +67,7 @@ def scan_directories(directory, size_gb, size_mb, output_file, no_size, no_table
     "-d",
     "--directory",
     "directory",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True),
+    type=click.Path(file_okay=False, dir_okay=True, resolve_path=True),
     default=DEFAULT_DIR,
     help="Directory to search (default: current directory)",
 )
@@ -2,9 +2,15 @@
 
 import logging
 import os
+from operator import itemgetter
+from typing import Any
 
 from find_large.constants import MB_TO_BYTES
-from find_large.core import SizeScannerBase
+from find_large.core import SizeScannerBase, add_to_path_trie, path_trie_matches
+
+logger = logging.getLogger(__name__)
+
+_file_size = itemgetter(1)
 
 
 class DirectoryScanner(SizeScannerBase):
@@ -14,6 +20,8 @@ class DirectoryScanner(SizeScannerBase):
         """Initialize the directory scanner."""
         super().__init__(*args, **kwargs)
         self.dir_sizes: dict[str, int] = {}
+        # Trie of the directories counted in total_bytes so far
+        self._counted_paths: dict[str, Any] = {}
 
     def scan(self) -> None:
         """Scan for large directories."""
@@ -21,87 +29,69 @@ class DirectoryScanner(SizeScannerBase):
             self.dir_sizes = {}
             self.items_list = []
             self.total_bytes = 0
-
-            for root, dirs, files in os.walk(self.search_dir):
-                if self.verbose:
-                    logging.debug(f"Scanning directory: {root}")
-
-                # Skip excluded directories
-                if self.should_skip_path(root):
-                    dirs[:] = []
-                    continue
-
-                # Filter out hidden directories
-                original_dirs_count = len(dirs)
-                dirs[:] = [d for d in dirs if not d.startswith(".")]
-                if self.verbose and original_dirs_count != len(dirs):
-                    logging.debug(
-                        "Filtered out %s hidden directories",
-                        original_dirs_count - len(dirs),
-                    )
-
-                # Calculate directory size for files directly under this directory
-                dir_size = 0
-                for filename in files:
-                    if filename.startswith("."):
-                        continue
-                    file_path = os.path.join(root, filename)
-                    try:
-                        size_bytes = os.path.getsize(file_path)
-                        dir_size += size_bytes
-                    except (OSError, FileNotFoundError) as e:
-                        if self.verbose:
-                            logging.debug(
-                                "Could not access file %s: %s",
-                                file_path,
-                                str(e),
-                            )
-                        continue
-
+            self.items_found = 0
+            self._counted_paths = {}
+            # With sizes hidden, a directory only has to be shown to reach the
+            # threshold. Once its own files add up to it, the rest need no stat call;
+            # every total then stays a lower bound that is exact below the threshold.
+            # --top ranks by size, so it needs exact totals.
+            if self.no_size and self.top is None:
+                self.listing_size_limit = self.size_bytes_threshold
+            else:
+                self.listing_size_limit = None
+
+            for root, files in self.walk():
                 # Store direct file size for this directory
-                self.dir_sizes[root] = dir_size
-
-            # Aggregate sizes from children to parents for recursive totals
-            for path in sorted(
-                self.dir_sizes.keys(),
-                key=lambda p: p.count(os.sep),
-                reverse=True,
-            ):
+                self.dir_sizes[root] = sum(map(_file_size, files))
+
+            # Aggregate sizes from children to parents for recursive totals. The walk
+            # yields every directory before its subdirectories, so in reverse order a
+            # directory's total is complete before it is added to its parent, and it
+            # can be checked against the threshold in the same pass. The filesystem
+            # root is its own dirname, so it must not be added to itself.
+            dir_sizes = self.dir_sizes
+            threshold = self.size_bytes_threshold
+            large_dirs: list[str] = []
+            for path, size_bytes in reversed(dir_sizes.items()):
+                if size_bytes >= threshold:
+                    large_dirs.append(path)
                 parent = os.path.dirname(path)
-                if parent in self.dir_sizes:
-                    self.dir_sizes[parent] += self.dir_sizes[path]
-
-            # Add directories meeting size threshold
-            for path, size_bytes in self.dir_sizes.items():
-                if size_bytes >= self.size_bytes_threshold:
-                    if self.verbose:
-                        logging.debug(
-                            "Found large directory: %s (%.2f MB)",
-                            path,
-                            size_bytes / MB_TO_BYTES,
-                        )
-                    self.items_list.append((path, size_bytes))
-
-            self.total_bytes = self._calculate_total_bytes()
-
+                if parent != path and parent in dir_sizes:
+                    dir_sizes[parent] += size_bytes
+
+            # Add directories meeting size threshold, back in walk order
+            verbose = self.verbose
+            for path in reversed(large_dirs):
+                size_bytes = dir_sizes[path]
+                if verbose:
+                    logger.debug(
+                        "Found large directory: %s (%.2f MB)",
+                        path,
+                        size_bytes / MB_TO_BYTES,
+                    )
+                self.add_item(path, size_bytes)
         except Exception as e:
             self.error_exit(f"An error occurred during directory search: {e}")
 
-    def _calculate_total_bytes(self) -> int:
-        """Calculate total size without double-counting nested directories.
+    def counted_size(self, item_path: str, size_bytes: int) -> int:
+        """Count a directory in ``total_bytes`` unless a parent was already counted.
+
+        Items are recorded in walk order, or largest first with ties in walk order
+        when ``top`` or ``largest_first`` is set. Both put every directory before its
+        subdirectories, so a parent is always counted before any nested match. The
+        total is never shown without sizes, so it is not worked out then.
+
+        Args:
+            item_path: Path of the directory.
+            size_bytes: Recursive size of the directory in bytes.
 
         Returns:
-            int: Total size in bytes for non-overlapping directories.
+            int: The size of the directory, or 0 if it lies inside a counted one.
         """
-        total_bytes = 0
-        counted_paths: list[str] = []
-        for dir_path, size_bytes in sorted(self.items_list, key=lambda item: item[0].count(os.sep)):
-            abs_path = os.path.abspath(dir_path)
-            if any(
-                abs_path == parent or abs_path.startswith(parent + os.sep)
-                for parent in counted_paths
-            ):
-                continue
-            total_bytes += size_bytes
-            counted_paths.append(abs_path)
-        return total_bytes
+        if self.no_size:
+            return 0
+        abs_path = os.path.abspath(item_path)
+        if path_trie_matches(self._counted_paths, abs_path):
+            return 0
+        add_to_path_trie(self._counted_paths, abs_path)
+        return size_bytes
@@ -1,8 +1,12 @@
 """Terminal output formatting and styling for find-large-files."""
 
+from functools import lru_cache
+from typing import TextIO
+
 from rich.console import Console
 from rich.status import Status
 from rich.table import Table
+from rich.text import Text
 
 # Initialize console
 console: Console = Console()
@@ -20,6 +24,15 @@ STYLES: dict[str, str] = {
     "status": "bold green",
 }
 
+# Results with more rows than this are printed as pre-aligned text instead of a
+# rich Table, which measures and renders every cell separately
+MAX_TABLE_ROWS: int = 500
+
+# Results table columns
+LOCATION_COLUMN: str = "File Location"
+SIZE_COLUMN: str = "File Size"
+SIZE_COLUMN_WIDTH: int = 12
+
 # Common ASCII art for all commands
 ASCII_ART: str = """
 ╔═╗╦╔╗╔╔╦╗  ╦  ╔═╗╦═╗╔═╗╔═╗
@@ -27,11 +40,16 @@ ASCII_ART: str = """
 ╚  ╩╝╚╝═╩╝  ╩═╝╩ ╩╩╚═╚═╝╚═╝"""
 
 
-def print_ascii_art(script_type: str = "files") -> None:
-    """Print ASCII art banner based on script type."""
-    # Print the common ASCII art
-    console.print(ASCII_ART, style=STYLES["ascii_art"])
+@lru_cache(maxsize=8)
+def render_ascii_art(script_type: str = "files") -> str:
+    """Render the ASCII art banner for a script type as Rich markup.
 
+    Args:
+        script_type: Command to highlight in the banner.
+
+    Returns:
+        str: Banner markup, ready to be printed by a Rich console.
+    """
     # Format each command based on whether it's the current one
     commands: list[str] = ["FILES", "DIRS", "VIDS"]
     formatted_commands: list[str] = []
@@ -46,14 +64,23 @@ def print_ascii_art(script_type: str = "files") -> None:
                 f"[{STYLES['inactive_command']}]{cmd}[/{STYLES['inactive_command']}]"
             )
 
-    # Join with separator and print
+    # Join with separator below the common ASCII art
     command_line: str = " | ".join(formatted_commands)
-    console.print(f"    {command_line}\n")
+    return f"[{STYLES['ascii_art']}]{ASCII_ART}[/{STYLES['ascii_art']}]\n    {command_line}\n"
+
+
+def print_ascii_art(script_type: str = "files") -> None:
+    """Print ASCII art banner based on script type."""
+    console.print(render_ascii_art(script_type))
 
 
 def print_error(message: str) -> None:
-    """Print an error message."""
-    console.print(f"Error: {message}", style=STYLES["error"])
+    """Print an error message.
+
+    The message is printed as-is, so paths and hints such as ``find-large[arrow]``
+    are not read as rich markup.
+    """
+    console.print(f"Error: {message}", style=STYLES["error"], markup=False)
 
 
 def print_success(message: str) -> None:
@@ -76,9 +103,9 @@ def create_results_table(show_size: bool = True) -> Table:
         Table: Configured results table.
     """
     table = Table(show_header=True, header_style=STYLES["header"], show_lines=True)
-    table.add_column("File Location", overflow="crop", no_wrap=True)
+    table.add_column(LOCATION_COLUMN, overflow="crop", no_wrap=True)
     if show_size:
-        table.add_column("File Size", justify="right", width=12)
+        table.add_column(SIZE_COLUMN, justify="right", width=SIZE_COLUMN_WIDTH)
     return table
 
 
@@ -93,32 +120,95 @@ def format_table(
     output_console: Console = file_console if file_console else console
 
     if no_table:
-        # Plain text output
+        # Plain text output; rows for a file are written without going through rich
         for line in data_lines[1:]:  # Skip header
-            if no_size:
-                output_console.print(line[0])
+            if file_console:
+                write_plain_row(file_console.file, line, no_size)
             else:
-                output_console.print(f"{line[0]}\t{line[1]}")
+                print_plain_row(output_console, line, no_size)
 
-        if not no_size and total_bytes > 0:
-            output_console.print("\nTotal Size Summary")
-            output_console.print("─" * 50)
-            _print_total_size(output_console, total_bytes, plain=True)
+        print_plain_summary(output_console, total_bytes, no_size)
+    elif len(data_lines) - 1 > MAX_TABLE_ROWS:
+        print_aligned_rows(output_console, data_lines, no_size)
+        _print_table_summary(output_console, total_bytes, no_size)
     else:
         table: Table = create_results_table(not no_size)
 
+        # Cells are passed as Text so paths containing "[" are not parsed as markup
         for line in data_lines[1:]:  # Skip header
             if no_size:
-                table.add_row(line[0])
+                table.add_row(Text(line[0]))
             else:
-                table.add_row(line[0], line[1])
+                table.add_row(Text(line[0]), Text(line[1]))
 
         output_console.print(table)
+        _print_table_summary(output_console, total_bytes, no_size)
+
+
+def print_aligned_rows(
+    output_console: Console, data_lines: list[tuple[str, ...]], no_size: bool = False
+) -> None:
+    """Print results as aligned columns, rendered as one block of text.
+
+    Args:
+        output_console: Console to print to.
+        data_lines: Header row followed by the result rows. The header is replaced
+            by the results table's column titles.
+        no_size: Whether the rows lack a size column.
+    """
+    rows = data_lines[1:]
+    if no_size:
+        output_console.print(LOCATION_COLUMN, style=STYLES["header"], highlight=False)
+        body = "\n".join(line[0] for line in rows)
+    else:
+        path_width = max(len(LOCATION_COLUMN), *(len(line[0]) for line in rows))
+        output_console.print(
+            f"{LOCATION_COLUMN.ljust(path_width)}  {SIZE_COLUMN.rjust(SIZE_COLUMN_WIDTH)}",
+            style=STYLES["header"],
+            highlight=False,
+        )
+        body = "\n".join(
+            f"{line[0].ljust(path_width)}  {line[1].rjust(SIZE_COLUMN_WIDTH)}" for line in rows
+        )
+    # Printed as-is: no markup parsing, highlighting or re-wrapping of long paths
+    output_console.print(body, markup=False, highlight=False, soft_wrap=True)
+
+
+def _print_table_summary(output_console: Console, total_bytes: int, no_size: bool) -> None:
+    """Print the total size summary below the results table."""
+    if not no_size and total_bytes > 0:
+        output_console.print("\n[bold cyan]Total Size Summary[/bold cyan]")
+        output_console.print("─" * 50)
+        _print_total_size(output_console, total_bytes)
+
+
+def print_plain_row(output_console: Console, line: tuple[str, ...], no_size: bool = False) -> None:
+    """Print a single result row in plain text format."""
+    text = line[0] if no_size else f"{line[0]}\t{line[1]}"
+    # Paths are printed verbatim: no markup, emoji, highlighting or re-wrapping
+    output_console.print(text, markup=False, emoji=False, highlight=False, soft_wrap=True)
+
+
+def write_plain_row(output: TextIO, line: tuple[str, ...], no_size: bool = False) -> None:
+    """Write a single result row in plain text format straight to a file.
+
+    Unlike ``print_plain_row``, the row skips rich's rendering, which costs far more
+    than the write itself when there are many rows.
+
+    Args:
+        output: Text file to write to.
+        line: Formatted result row.
+        no_size: Whether the row lacks a size column.
+    """
+    output.write(f"{line[0]}\n" if no_size else f"{line[0]}\t{line[1]}\n")
+
 
-        if not no_size and total_bytes > 0:
-            output_console.print("\n[bold cyan]Total Size Summary[/bold cyan]")
-            output_console.print("─" * 50)
-            _print_total_size(output_console, total_bytes)
+def print_plain_summary(output_console: Console, total_bytes: int, no_size: bool = False) -> None:
+    """Print the total size summary in plain text format."""
+    if not no_size and total_bytes > 0:
+        output_console.print("\nTotal Size Summary")
+        output_console.print("─" * 50)
+        _print_total_size(output_console, total_bytes, plain=True)
 
 
 def _print_total_size(console: Console, total_bytes: int, plain: bool = False) -> None:
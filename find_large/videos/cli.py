@@ -5,7 +5,10 @@ import os
 import click
 
 from find_large import formatting
+from find_large.cache import open_cache
 from find_large.constants import (
+    CACHE_FILE,
+    DEFAULT_CACHE_TTL,
     DEFAULT_DIR,
     DEFAULT_SIZE_GB,
     DEFAULT_SIZE_MB,
@@ -15,7 +18,19 @@ from find_large.constants import (
 from find_large.videos.core import find_large_videos
 
 
-def scan_videos(directory, size_gb, size_mb, output_file, no_size, no_table, verbose):
+def scan_videos(
+    directory,
+    size_gb,
+    size_mb,
+    output_file,
+    no_size,
+    no_table,
+    verbose,
+    cache_file=None,
+    top=None,
+    cache=False,
+    cache_ttl=DEFAULT_CACHE_TTL,
+):
     """Core function to handle video scanning logic.
 
     Args:
@@ -26,6 +41,10 @@ def scan_videos(directory, size_gb, size_mb, output_file, no_size, no_table, ver
         no_size: Hide size column.
         no_table: Use plain text output.
         verbose: Enable verbose output.
+        cache_file: Cache database to use instead of ``CACHE_FILE``; implies ``cache``.
+        top: Only list this many of the largest videos, if set.
+        cache: Reuse directory listings from previous runs.
+        cache_ttl: Maximum age of a cached listing in seconds.
 
     Raises:
         click.Abort: If validation fails.
@@ -56,8 +75,23 @@ def scan_videos(directory, size_gb, size_mb, output_file, no_size, no_table, ver
 
     formatting.print_status(f"Searching for videos larger than {size_display} in {directory}...\n")
 
-    with formatting.get_status_context("Searching..."):
-        find_large_videos(directory, size_mb, output_file, size_unit, no_size, no_table, verbose)
+    scan_cache = open_cache(cache or cache_file is not None, cache_ttl, cache_file)
+    try:
+        with formatting.get_status_context("Searching..."):
+            find_large_videos(
+                directory,
+                size_mb,
+                output_file,
+                size_unit,
+                no_size,
+                no_table,
+                verbose,
+                cache=scan_cache,
+                top=top,
+            )
+    finally:
+        if scan_cache is not None:
+            scan_cache.close()
 
 
 @click.command()
@@ -65,7 +99,7 @@ def scan_videos(directory, size_gb, size_mb, output_file, no_size, no_table, ver
     "-d",
     "--directory",
     "directory",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True),
+    type=click.Path(file_okay=False, dir_okay=True, resolve_path=True),
     default=DEFAULT_DIR,
     help="Directory to search (default: current directory)",
 )
@@ -94,6 +128,31 @@ def scan_videos(directory, size_gb, size_mb, output_file, no_size, no_table, ver
 @click.option(
     "-nt", "--no-table", is_flag=True, help="Output in plain text format (one video per line)"
 )
+@click.option(
+    "-t",
+    "--top",
+    type=click.IntRange(min=1),
+    help="Only list the N largest videos, largest first",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    help=(
+        f"Reuse directory listings from previous runs (stored in {CACHE_FILE}); "
+        "a file that grew since then keeps its old size until --cache-ttl expires"
+    ),
+)
+@click.option(
+    "--cache-file",
+    type=click.Path(dir_okay=False),
+    help="Store the cache in this file instead (implies --cache)",
+)
+@click.option(
+    "--cache-ttl",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_CACHE_TTL,
+    help=f"Maximum age of cached listings in seconds (default: {DEFAULT_CACHE_TTL:g})",
+)
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose output showing search progress")
 def main(
     directory: str,
@@ -102,6 +161,10 @@ def main(
     output_file: str | None,
     no_size: bool,
     no_table: bool,
+    top: int | None,
+    cache: bool,
+    cache_file: str | None,
+    cache_ttl: float,
     verbose: bool,
 ) -> None:
     r"""Find large video files.
@@ -123,9 +186,25 @@ def main(
         output_file: Output file path.
         no_size: Hide size column.
         no_table: Use plain text output.
+        top: Only list this many of the largest videos, if set.
+        cache: Reuse directory listings from previous runs.
+        cache_file: Cache database to use instead of ``CACHE_FILE``.
+        cache_ttl: Maximum age of a cached listing in seconds.
         verbose: Enable verbose output.
     """
-    scan_videos(directory, size_gb, size_mb, output_file, no_size, no_table, verbose)
+    scan_videos(
+        directory,
+        size_gb,
+        size_mb,
+        output_file,
+        no_size,
+        no_table,
+        verbose,
+        cache_file,
+        top,
+        cache,
+        cache_ttl,
+    )
 
 
 if __name__ == "__main__":
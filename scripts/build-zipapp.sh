@@ -0,0 +1,127 @@
+#!/bin/bash
+set -euo pipefail
+
+# Script Description: Bundle find-large and its dependencies into a single .pyz zipapp
+# Author: elvee
+# Version: 0.1.0
+# License: MIT
+# Creation Date: 15/10/2026
+# Last Modified: 15/10/2026
+# Usage: build-zipapp.sh [OPTIONS]
+
+# Constants
+DEFAULT_OUTPUT_FILE="${PWD}/dist/find-large.pyz"
+DEFAULT_PYTHON="python3"
+ENTRY_POINT="find_large.cli:main"
+
+# ASCII Art (Calvin font)
+print_ascii_art() {
+  echo "
+╔╗   ╦ ╦  ╔╗╔  ╔╦╗  ╦    ╔═╗
+╠╩╗  ║ ║  ║║║   ║║  ║    ║╣
+╚═╝  ╚═╝  ╝╚╝  ═╩╝  ╩═╝  ╚═╝
+"
+}
+
+# Help
+show_help() {
+  echo "
+Usage: $0 [OPTIONS]
+
+Options:
+  -o, --output_file FILE     Write the zipapp to FILE (default: $DEFAULT_OUTPUT_FILE)
+  -p, --python PYTHON        Python used to build and in the shebang (default: $DEFAULT_PYTHON)
+  -c, --compress             Compress the archive (smaller, but slower to import from)
+  -h, --help                 Show help
+
+This script performs:
+  • pip install --target <staging dir> . (find_large plus rich and click)
+  • python -m zipapp <staging dir> -m $ENTRY_POINT
+
+Run the result with: ./find-large.pyz files -d /path/to/search
+Imports resolve from the single archive instead of walking site-packages.
+"
+}
+
+# Error handling
+error_exit() {
+  echo "Error: $1" >&2
+  exit 1
+}
+
+# Main logic
+main_logic() {
+  local output_file="$1"
+  local python="$2"
+  local compress="$3"
+
+  command -v "$python" >/dev/null 2>&1 || error_exit "Python interpreter not found: $python"
+
+  # Global so the EXIT trap can still see it after main_logic returns
+  STAGING_DIR="$(mktemp -d)"
+  trap 'rm -rf "${STAGING_DIR:?}"' EXIT
+  local staging="$STAGING_DIR"
+
+  echo "[+] Installing find_large and its dependencies into ${staging}..."
+  "$python" -m pip install --quiet --no-compile --target "$staging" .
+
+  # Console scripts and package metadata are not needed inside the archive
+  rm -rf "${staging:?}/bin" "${staging:?}"/*.dist-info
+
+  echo "[+] Building ${output_file}..."
+  mkdir -p "$(dirname "$output_file")"
+  local zipapp_args=(-m "$ENTRY_POINT" -p "/usr/bin/env ${python}" -o "$output_file")
+  if [[ "$compress" == "true" ]]; then
+    zipapp_args+=(-c)
+  fi
+  "$python" -m zipapp "$staging" "${zipapp_args[@]}"
+
+  echo "[+] Done. Run it with: ${output_file} --help"
+}
+
+# Main
+main() {
+  local output_file="$DEFAULT_OUTPUT_FILE"
+  local python="$DEFAULT_PYTHON"
+  local compress="false"
+
+  while [[ $# -gt 0 ]]; do
+    case "$1" in
+      -o|--output_file)
+        if [[ -n "${2:-}" && "${2}" != -* ]]; then
+          output_file="$2"
+          shift 2
+        else
+          error_exit "Missing output file path for $1"
+        fi
+        ;;
+      -p|--python)
+        if [[ -n "${2:-}" && "${2}" != -* ]]; then
+          python="$2"
+          shift 2
+        else
+          error_exit "Missing Python interpreter for $1"
+        fi
+        ;;
+      -c|--compress)
+        compress="true"
+        shift
+        ;;
+      -h|--help)
+        show_help
+        exit 0
+        ;;
+      *)
+        error_exit "Invalid option: $1"
+        ;;
+    esac
+  done
+
+  main_logic "$output_file" "$python" "$compress"
+}
+
+# Header ASCII art
+print_ascii_art
+
+# Execute
+main "$@"
@@ -0,0 +1,112 @@
+"""Shared pytest fixtures."""
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+import pytest
+from click.testing import CliRunner, Result
+
+from find_large import constants
+from find_large.cli import cli
+from find_large.core import SizeScannerBase
+
+ScannerT = TypeVar("ScannerT", bound=SizeScannerBase)
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Create a CLI runner shared by every test.
+
+    ``CliRunner`` keeps no state between ``invoke`` calls, so one instance is enough.
+
+    Returns:
+        CliRunner: Click CLI runner instance.
+    """
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def help_outputs(runner: CliRunner) -> dict[str, Result]:
+    """Render the group and subcommand help once per session.
+
+    Args:
+        runner: Shared Click CLI runner.
+
+    Returns:
+        dict[str, Result]: ``--help`` results keyed by subcommand name, ``""`` for the group.
+    """
+    return {
+        name: runner.invoke(cli, [*([name] if name else []), "--help"])
+        for name in ("", "files", "dirs", "vids")
+    }
+
+
+@pytest.fixture(scope="session")
+def shared_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one empty directory for tests that only read from it.
+
+    Tests that write files must keep using ``tmp_path``.
+
+    Args:
+        tmp_path_factory: Session-scoped temporary directory factory.
+
+    Returns:
+        Path: Path to the shared directory.
+    """
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture
+def reset_root_logger(monkeypatch: pytest.MonkeyPatch) -> logging.Logger:
+    """Swap in a fresh root logger so a test cannot leak logging configuration.
+
+    Handlers and levels set through ``logging.basicConfig`` land on the replacement,
+    which is dropped again when the test finishes.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        logging.Logger: The replacement root logger at WARNING level.
+    """
+    root = logging.RootLogger(logging.WARNING)
+    monkeypatch.setattr(logging, "root", root)
+    return root
+
+
+@pytest.fixture
+def scanner_factory(tmp_path: Path) -> Callable[..., SizeScannerBase]:
+    """Create a builder for scanners that search ``tmp_path`` by default.
+
+    ``exclude_folders_abs`` is not a constructor argument; when passed, it replaces
+    the default excludes once the scanner is built.
+
+    Args:
+        tmp_path: Per-test temporary directory.
+
+    Returns:
+        Callable[..., SizeScannerBase]: Builder taking the scanner class, optionally
+            the search directory, and keyword overrides for the defaults.
+    """
+
+    def make(
+        scanner_cls: type[ScannerT], search_dir: str | Path | None = None, **overrides: object
+    ) -> ScannerT:
+        exclude_folders_abs = overrides.pop("exclude_folders_abs", None)
+        kwargs: dict[str, object] = {
+            "size_mb": 100,
+            "output_file": None,
+            "size_unit": constants.SIZE_UNIT_MB,
+            "no_size": False,
+            "no_table": False,
+            "verbose": False,
+        }
+        kwargs.update(overrides)
+        scanner = scanner_cls(search_dir=str(search_dir or tmp_path), **kwargs)
+        if exclude_folders_abs is not None:
+            scanner.exclude_folders_abs = exclude_folders_abs
+        return scanner
+
+    return make
@@ -11,15 +11,6 @@ from find_large.dirs.cli import main, scan_directories
 class TestDirsCLIEntryPoints:
     """Test cases for dirs CLI entry point."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner for testing.
-
-        Returns:
-            CliRunner: Click test runner instance.
-        """
-        return CliRunner()
-
     def test_main_help_displays_help(self, runner: CliRunner) -> None:
         """Test main command displays help text."""
         result = runner.invoke(main, ["--help"])
@@ -1,25 +1,20 @@
 """End-to-end tests for files CLI entry point."""
 
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
 
 from find_large.files.cli import main, scan_files
 
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "files"
+
 
 class TestFilesCLIEntryPoints:
     """Test cases for files CLI entry point."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner for testing.
-
-        Returns:
-            CliRunner: Click test runner instance.
-        """
-        return CliRunner()
-
     def test_main_help_displays_help(self, runner: CliRunner) -> None:
         """Test main command displays help text."""
         result = runner.invoke(main, ["--help"])
@@ -44,6 +39,36 @@ class TestFilesCLIEntryPoints:
         assert result.exit_code == 0
         assert output_file.exists()
 
+    def test_main_top_lists_largest_first(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test main command only lists the N largest items, largest first."""
+        for name in ("large_2k.bin", "large_4k.bin", "large_5k.bin"):
+            shutil.copyfile(FIXTURES_DIR / name, tmp_path / name)
+        result = runner.invoke(main, ["-d", str(tmp_path), "-s", "0.001", "-t", "2", "-n", "-nt"])
+        assert result.exit_code == 0
+        listed = [line for line in result.output.splitlines() if line.startswith(f"{tmp_path}/")]
+        assert listed == [str(tmp_path / "large_5k.bin"), str(tmp_path / "large_4k.bin")]
+
+    def test_main_with_cache(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test main command stores directory listings in the default cache file."""
+        cache_file = tmp_path / "cache" / "sizes.sqlite"
+        search_dir = tmp_path / "search"
+        search_dir.mkdir()
+        with patch("find_large.cache.CACHE_FILE", str(cache_file)):
+            result = runner.invoke(main, ["-d", str(search_dir), "-s", "1", "--cache"])
+        assert result.exit_code == 0
+        assert cache_file.exists()
+
+    def test_main_with_cache_file(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test main command stores directory listings in the given cache file."""
+        cache_file = tmp_path / "cache" / "custom.sqlite"
+        search_dir = tmp_path / "search"
+        search_dir.mkdir()
+        result = runner.invoke(
+            main, ["-d", str(search_dir), "-s", "1", "--cache-file", str(cache_file)]
+        )
+        assert result.exit_code == 0
+        assert cache_file.exists()
+
     def test_main_no_size_flag(self, runner: CliRunner, tmp_path: Path) -> None:
         """Test main command with no-size flag."""
         result = runner.invoke(main, ["-d", str(tmp_path), "-s", "1", "-n"])
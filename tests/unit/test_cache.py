@@ -0,0 +1,100 @@
+"""Unit tests for the persistent scan cache."""
+
+import shutil
+import sqlite3
+from pathlib import Path
+
+from find_large import constants
+from find_large.cache import ScanCache
+from find_large.files.scanner import FileScanner
+from find_large.videos.scanner import VideoScanner
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "files"
+VIDEO_FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "videos"
+
+
+def test_get__returns_stored_listing(tmp_path: Path) -> None:
+    """Test a stored listing is returned while the mtime matches."""
+    with ScanCache(str(tmp_path / "cache.sqlite")) as cache:
+        cache.put("/data", 42, [("/data/a.bin", 2048)], ["/data/sub"])
+        assert cache.get("/data", 42) == ([("/data/a.bin", 2048)], ["/data/sub"])
+
+
+def test_get__misses_on_changed_mtime(tmp_path: Path) -> None:
+    """Test a listing is ignored once the directory mtime changes."""
+    with ScanCache(str(tmp_path / "cache.sqlite")) as cache:
+        cache.put("/data", 42, [], [])
+        assert cache.get("/data", 43) is None
+        assert cache.get("/other", 42) is None
+
+
+def test_get__misses_on_replaced_directory(tmp_path: Path) -> None:
+    """Test a listing is ignored when another directory now has the same path."""
+    with ScanCache(str(tmp_path / "cache.sqlite")) as cache:
+        cache.put("/data", 42, [], [], dev=1, ino=100)
+        assert cache.get("/data", 42, dev=1, ino=100) == ([], [])
+        assert cache.get("/data", 42, dev=1, ino=101) is None
+        assert cache.get("/data", 42, dev=2, ino=100) is None
+
+
+def test_init__rebuilds_outdated_schema(tmp_path: Path) -> None:
+    """Test a cache written with an older table layout is dropped and recreated."""
+    cache_file = str(tmp_path / "cache.sqlite")
+    conn = sqlite3.connect(cache_file)
+    conn.execute(
+        "CREATE TABLE dirs (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+        "scanned_at REAL NOT NULL, listing TEXT NOT NULL)"
+    )
+    conn.execute("INSERT INTO dirs VALUES ('/data', 42, 0, '[[], []]')")
+    conn.commit()
+    conn.close()
+
+    with ScanCache(cache_file) as cache:
+        assert cache.get("/data", 42) is None
+        cache.put("/data", 42, [], [])
+        assert cache.get("/data", 42) == ([], [])
+
+
+def test_get__misses_on_expired_entry(tmp_path: Path) -> None:
+    """Test a listing older than the TTL is ignored."""
+    with ScanCache(str(tmp_path / "cache.sqlite"), ttl=-1) as cache:
+        cache.put("/data", 42, [], [])
+        assert cache.get("/data", 42) is None
+
+
+def test_close__persists_listings(tmp_path: Path) -> None:
+    """Test listings survive reopening the cache."""
+    cache_file = str(tmp_path / "nested" / "cache.sqlite")
+    with ScanCache(cache_file) as cache:
+        cache.put("/data", 42, [("/data/a.bin", 1)], [])
+    with ScanCache(cache_file) as cache:
+        assert cache.get("/data", 42) == ([("/data/a.bin", 1)], [])
+
+
+def test_put__concurrent_caches_do_not_lock_each_other(tmp_path: Path) -> None:
+    """Test two open caches on one database can both write without waiting."""
+    cache_file = str(tmp_path / "cache.sqlite")
+    with ScanCache(cache_file) as first, ScanCache(cache_file) as second:
+        first.put("/one", 1, [], [])
+        second.put("/two", 2, [], [])
+        assert second.get("/one", 1) == ([], [])
+        assert first.get("/two", 2) == ([], [])
+
+
+def test_scanners__share_cached_listings(tmp_path: Path) -> None:
+    """Test listings cached by one scanner give correct results for another."""
+    tree = tmp_path / "tree"
+    (tree / "sub").mkdir(parents=True)
+    shutil.copyfile(VIDEO_FIXTURES_DIR / "large_2k.mp4", tree / "movie.mp4")
+    shutil.copyfile(FIXTURES_DIR / "large_3k.bin", tree / "sub" / "data.bin")
+
+    with ScanCache(str(tmp_path / "cache.sqlite")) as cache:
+        videos = VideoScanner(str(tree), 0.001, None, constants.SIZE_UNIT_MB, cache=cache)
+        videos.exclude_folders_abs = []
+        videos.scan()
+        files = FileScanner(str(tree), 0.001, None, constants.SIZE_UNIT_MB, cache=cache)
+        files.exclude_folders_abs = []
+        files.scan()
+
+    assert [Path(path).name for path, _ in videos.items_list] == ["movie.mp4"]
+    assert sorted(Path(path).name for path, _ in files.items_list) == ["data.bin", "movie.mp4"]
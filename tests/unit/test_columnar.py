@@ -0,0 +1,57 @@
+"""Unit tests for columnar result output."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from find_large import constants, formatting
+from find_large.columnar import ColumnarWriter, is_columnar_output
+from find_large.files.scanner import FileScanner
+
+
+@pytest.mark.parametrize(
+    ("output_file", "expected"),
+    [
+        ("results.arrow", True),
+        ("results.PARQUET", True),
+        ("results.txt", False),
+        (None, False),
+    ],
+)
+def test_is_columnar_output__checks_extension(output_file: str | None, expected: bool) -> None:
+    """Test columnar output is selected by file extension."""
+    assert is_columnar_output(output_file) is expected
+
+
+def test_columnar_writer__writes_arrow_stream(tmp_path: Path) -> None:
+    """Test rows are written to an Arrow IPC stream in batches."""
+    pa = pytest.importorskip("pyarrow")
+    output_file = tmp_path / "results.arrow"
+    writer = ColumnarWriter(str(output_file), batch_size=2)
+    for index in range(5):
+        writer.write(f"/data/file{index}", index * 1024)
+    writer.close()
+
+    with pa.ipc.open_stream(str(output_file)) as reader:
+        table = reader.read_all()
+    assert table.column("path").to_pylist() == [f"/data/file{index}" for index in range(5)]
+    assert table.column("size").to_pylist() == [index * 1024 for index in range(5)]
+
+
+def test_run__requires_pyarrow_for_columnar_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test a missing pyarrow install is reported instead of crashing."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    scanner = FileScanner(
+        search_dir=str(tmp_path),
+        size_mb=1,
+        output_file=str(tmp_path / "results.parquet"),
+        size_unit=constants.SIZE_UNIT_MB,
+    )
+    monkeypatch.setattr(formatting, "console", Console(width=200))
+    with pytest.raises(SystemExit):
+        scanner.run()
+    assert "pip install 'find-large[arrow]'" in capsys.readouterr().out
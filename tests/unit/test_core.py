@@ -2,19 +2,27 @@
 
 import logging
 import os
+import sys
+from collections.abc import Callable
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from find_large import constants
-from find_large.core import SizeScannerBase
+from find_large.core import (
+    SizeScannerBase,
+    add_to_path_trie,
+    build_path_trie,
+    path_trie_matches,
+)
 
 
 class MockScanner(SizeScannerBase):
     """Mock scanner for testing SizeScannerBase.
 
     Attributes:
-        items_list: List of found items.
+        items_list: (path, size) pairs of the found items.
         total_bytes: Total bytes of found items.
     """
 
@@ -27,24 +35,26 @@ class MockScanner(SizeScannerBase):
         self.total_bytes = 1024
 
 
+class StreamingMockScanner(SizeScannerBase):
+    """Mock scanner that reports items through add_item."""
+
+    streams_results = True
+
+    def scan(self) -> None:
+        """Mock scan implementation reporting two items."""
+        self.add_item("/mock/one", 1024)
+        self.add_item("/mock/two", 2048)
+
+
 @pytest.fixture
-def mock_scanner(tmp_path: Path) -> MockScanner:
+def mock_scanner(tmp_path: Path, scanner_factory: Callable[..., SizeScannerBase]) -> MockScanner:
     """Create a mock scanner instance.
 
     Returns:
         MockScanner: Mock scanner instance.
     """
-    expected_search_dir = tmp_path
-    scanner = MockScanner(
-        search_dir=str(expected_search_dir),
-        size_mb=100,
-        output_file=None,
-        size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
-    scanner.expected_search_dir = expected_search_dir
+    scanner = scanner_factory(MockScanner)
+    scanner.expected_search_dir = tmp_path
     return scanner
 
 
@@ -67,7 +77,30 @@ def test_scanner_initialization__calculates_size_bytes_threshold(mock_scanner: M
 
 def test_scanner_initialization__initializes_empty_items_list(mock_scanner: MockScanner) -> None:
     """Test scanner initializes empty items list."""
-    assert mock_scanner.items_list == []
+    assert mock_scanner.items_list == ()
+
+
+def test_items_list__is_read_only(mock_scanner: MockScanner) -> None:
+    """Test items_list cannot be changed in place, only replaced."""
+    mock_scanner.items_list = [("/b", 1), ("/a", 2)]
+    with pytest.raises(AttributeError):
+        mock_scanner.items_list.append(("/c", 3))
+    with pytest.raises(AttributeError):
+        mock_scanner.items_list.sort()
+    assert mock_scanner.items_list == (("/b", 1), ("/a", 2))
+
+
+def test_finish_top_items__records_held_back_items_once(
+    scanner_factory: Callable[..., SizeScannerBase],
+) -> None:
+    """Test items held back for top appear after finish_top_items, and only once."""
+    scanner = scanner_factory(StreamingMockScanner, top=1)
+    scanner.scan()
+    assert scanner.items_list == ()
+    scanner.finish_top_items()
+    scanner.finish_top_items()
+    assert scanner.items_list == (("/mock/two", 2048),)
+    assert scanner.total_bytes == 2048
 
 
 def test_scanner_initialization__initializes_zero_total_bytes(mock_scanner: MockScanner) -> None:
@@ -77,49 +110,33 @@ def test_scanner_initialization__initializes_zero_total_bytes(mock_scanner: Mock
 
 def test_setup_logging__sets_info_level_by_default(mock_scanner: MockScanner) -> None:
     """Test logging setup uses INFO level by default."""
-    # Reset root logger to ensure clean state
-    logging.getLogger().handlers.clear()
-    logging.getLogger().setLevel(logging.WARNING)
-    mock_scanner.setup_logging()
-    assert logging.getLogger().level == logging.INFO
+    with patch("find_large.core.logging.basicConfig") as basic_config:
+        mock_scanner.setup_logging()
+    assert basic_config.call_args.kwargs["level"] == logging.INFO
 
 
 def test_setup_logging__sets_debug_level_when_verbose(mock_scanner: MockScanner) -> None:
     """Test logging setup uses DEBUG level when verbose."""
-    # Reset root logger to ensure clean state
-    logging.getLogger().handlers.clear()
-    logging.getLogger().setLevel(logging.WARNING)
     mock_scanner.verbose = True
-    mock_scanner.setup_logging()
-    assert logging.getLogger().level == logging.DEBUG
+    with patch("find_large.core.logging.basicConfig") as basic_config:
+        mock_scanner.setup_logging()
+    assert basic_config.call_args.kwargs["level"] == logging.DEBUG
 
 
-def test_should_skip_path__skips_hidden_folders(tmp_path: Path) -> None:
+def test_should_skip_path__skips_hidden_folders(
+    tmp_path: Path, scanner_factory: Callable[..., SizeScannerBase]
+) -> None:
     """Test scanner skips hidden folders."""
-    scanner = MockScanner(
-        search_dir=str(tmp_path),
-        size_mb=100,
-        output_file=None,
-        size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
+    scanner = scanner_factory(MockScanner)
     hidden_path = os.path.join(str(tmp_path), ".hidden_folder")
     assert scanner.should_skip_path(hidden_path) is True
 
 
-def test_should_skip_path__includes_git_folder(tmp_path: Path) -> None:
+def test_should_skip_path__includes_git_folder(
+    tmp_path: Path, scanner_factory: Callable[..., SizeScannerBase]
+) -> None:
     """Test scanner includes .git folder."""
-    scanner = MockScanner(
-        search_dir=str(tmp_path),
-        size_mb=100,
-        output_file=None,
-        size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
+    scanner = scanner_factory(MockScanner)
     scanner.exclude_folders_abs = []
     # Create a .git directory to test
     git_dir = tmp_path / ".git"
@@ -129,32 +146,71 @@ def test_should_skip_path__includes_git_folder(tmp_path: Path) -> None:
     assert result is False
 
 
-def test_should_skip_path__skips_excluded_system_paths(tmp_path: Path) -> None:
+def test_should_skip_path__skips_excluded_system_paths(
+    scanner_factory: Callable[..., SizeScannerBase],
+) -> None:
     """Test scanner skips excluded system paths."""
-    scanner = MockScanner(
-        search_dir=str(tmp_path),
-        size_mb=100,
-        output_file=None,
-        size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
+    scanner = scanner_factory(MockScanner)
     system_path = "/System/Library"
     assert scanner.should_skip_path(system_path) is True
 
 
-def test_should_skip_path__does_not_skip_normal_paths(tmp_path: Path) -> None:
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux pseudo-filesystems")
+def test_should_skip_path__skips_pseudo_filesystems(
+    scanner_factory: Callable[..., SizeScannerBase],
+) -> None:
+    """Test scanner skips /proc and friends unless they are the search directory."""
+    scanner = scanner_factory(MockScanner)
+    assert scanner.should_skip_path("/proc") is True
+    assert scanner.should_skip_path("/sys") is True
+
+    proc_scanner = scanner_factory(MockScanner, "/proc")
+    assert proc_scanner.should_skip_path("/proc") is False
+
+
+def test_walk__visits_directories_in_os_walk_order(
+    tmp_path: Path, scanner_factory: Callable[..., SizeScannerBase]
+) -> None:
+    """Test a single-job walk yields directories in the same order as os.walk."""
+    for name in ("b/y", "a/z", "a/x", "c"):
+        (tmp_path / name).mkdir(parents=True)
+    scanner = scanner_factory(MockScanner)
+    scanner.exclude_folders_abs = []
+    expected = [root for root, _, _ in os.walk(tmp_path)]
+    assert [root for root, _ in scanner.walk()] == expected
+
+
+def test_walk__one_file_system_skips_other_devices(
+    tmp_path: Path, scanner_factory: Callable[..., SizeScannerBase], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test walk does not descend into directories on another device."""
+    mount_point = tmp_path / "mnt"
+    mount_point.mkdir()
+    scanner = scanner_factory(MockScanner, one_file_system=True)
+    scanner.exclude_folders_abs = []
+    assert sorted(root for root, _ in scanner.walk()) == [str(tmp_path), str(mount_point)]
+
+    # Pretend the subdirectory is the mount point of another filesystem
+    real_stat = os.stat
+
+    def fake_stat(path: str, *args: object, **kwargs: object) -> os.stat_result:
+        result = real_stat(path, *args, **kwargs)
+        if path == str(mount_point):
+            fields = list(result)
+            fields[2] += 1  # st_dev
+            return os.stat_result(fields)
+        return result
+
+    monkeypatch.setattr(os, "stat", fake_stat)
+    monkeypatch.setattr("find_large.core.SCANDIR_ACCEPTS_FD", False)
+    assert [root for root, _ in scanner.walk()] == [str(tmp_path)]
+
+
+def test_should_skip_path__does_not_skip_normal_paths(
+    tmp_path: Path, scanner_factory: Callable[..., SizeScannerBase]
+) -> None:
     """Test scanner does not skip normal paths."""
-    scanner = MockScanner(
-        search_dir=str(tmp_path),
-        size_mb=100,
-        output_file=None,
-        size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
+    scanner = scanner_factory(MockScanner)
     # Use a normal path that doesn't start with excluded paths
     # Note: On macOS, tmp_path is under /private/var/folders which is excluded
     # So we test with a relative path instead
@@ -211,53 +267,105 @@ def test_save_results__without_output_file(mock_scanner: MockScanner) -> None:
     mock_scanner.save_results([("Location", "Size"), ("/path/to/file", "1.00 KB")])
 
 
-def test_save_results__with_output_file(tmp_path: Path) -> None:
+def test_save_results__with_output_file(
+    tmp_path: Path, scanner_factory: Callable[..., SizeScannerBase]
+) -> None:
     """Test save_results writes to output file."""
     output_file = tmp_path / "output.txt"
-    scanner = MockScanner(
-        search_dir=str(tmp_path),
-        size_mb=100,
-        output_file=str(output_file),
-        size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
+    scanner = scanner_factory(MockScanner, output_file=str(output_file))
     scanner.items_list = [("/path/to/file", 1024)]
     scanner.total_bytes = 1024
     scanner.save_results([("Location", "Size"), ("/path/to/file", "1.00 KB")])
     assert output_file.exists()
 
 
-def test_save_results__handles_file_write_error(tmp_path: Path) -> None:
+def test_save_results__handles_file_write_error(
+    tmp_path: Path, scanner_factory: Callable[..., SizeScannerBase]
+) -> None:
     """Test save_results handles file write errors."""
     output_file = tmp_path / "invalid" / "output.txt"
-    scanner = MockScanner(
+    scanner = scanner_factory(MockScanner, output_file=str(output_file))
+    with pytest.raises(SystemExit):
+        scanner.save_results([("Location", "Size")])
+
+
+def test_run__executes_scan_and_formats_results(
+    scanner_factory: Callable[..., SizeScannerBase],
+) -> None:
+    """Test run method executes scan and formats results."""
+    scanner = scanner_factory(MockScanner)
+    scanner.run()
+    assert len(scanner.items_list) > 0
+
+
+def test_run__streams_plain_text_to_output_file(tmp_path: Path) -> None:
+    """Test run writes plain-text rows while scanning instead of buffering them."""
+    output_file = tmp_path / "output.txt"
+    with StreamingMockScanner(
         search_dir=str(tmp_path),
         size_mb=100,
         output_file=str(output_file),
         size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
-    with pytest.raises(SystemExit):
-        scanner.save_results([("Location", "Size")])
+        no_size=True,
+        no_table=True,
+    ) as scanner:
+        scanner.run()
+    assert scanner.items_list == ()
+    assert scanner.items_found == 2
+    assert scanner.total_bytes == 3072
+    lines = output_file.read_text().splitlines()
+    assert len(lines) == 2
+    assert "one" in lines[0]
+    assert "two" in lines[1]
 
 
-def test_run__executes_scan_and_formats_results(tmp_path: Path) -> None:
-    """Test run method executes scan and formats results."""
-    scanner = MockScanner(
+def test_run__writes_tab_separated_rows_to_output_file(tmp_path: Path) -> None:
+    """Test streamed rows are written verbatim, path and size separated by a tab."""
+    output_file = tmp_path / "output.txt"
+    with StreamingMockScanner(
+        search_dir=str(tmp_path),
+        size_mb=100,
+        output_file=str(output_file),
+        size_unit=constants.SIZE_UNIT_MB,
+        no_table=True,
+    ) as scanner:
+        scanner.run()
+    lines = output_file.read_text().splitlines()
+    assert lines[:2] == ["/mock/one\t0.00 MB", "/mock/two\t0.00 MB"]
+    assert "Total Size Summary" in lines
+
+
+def test_run__streams_plain_text_to_terminal(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test run prints plain-text rows as they are found without an output file."""
+    with StreamingMockScanner(
         search_dir=str(tmp_path),
         size_mb=100,
         output_file=None,
         size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
-    scanner.run()
-    assert len(scanner.items_list) > 0
+        no_table=True,
+    ) as scanner:
+        scanner.run()
+    assert scanner.items_list == ()
+    output = capsys.readouterr().out
+    assert "/mock/one" in output
+    assert "Total Size Summary" in output
+    assert "Results saved" not in output
+
+
+def test_close__closes_streamed_output_file(tmp_path: Path) -> None:
+    """Test leaving the context manager closes an open output stream."""
+    with StreamingMockScanner(
+        search_dir=str(tmp_path),
+        size_mb=100,
+        output_file=str(tmp_path / "output.txt"),
+        size_unit=constants.SIZE_UNIT_MB,
+        no_table=True,
+    ) as scanner:
+        scanner.open_output_stream()
+        output = scanner._output_console.file
+    assert output.closed
 
 
 def test_run__handles_scan_exception(tmp_path: Path) -> None:
@@ -282,31 +390,65 @@ def test_run__handles_scan_exception(tmp_path: Path) -> None:
         scanner.run()
 
 
-def test_error_exit__exits_with_error_message(tmp_path: Path) -> None:
+def test_error_exit__exits_with_error_message(
+    scanner_factory: Callable[..., SizeScannerBase],
+) -> None:
     """Test error_exit exits with error message."""
-    scanner = MockScanner(
-        search_dir=str(tmp_path),
-        size_mb=100,
-        output_file=None,
-        size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
+    scanner = scanner_factory(MockScanner)
     with pytest.raises(SystemExit):
         scanner.error_exit("Test error")
 
 
-def test_exclude_folders_abs__converts_to_absolute_paths(tmp_path: Path) -> None:
+def test_exclude_folders_abs__converts_to_absolute_paths(
+    scanner_factory: Callable[..., SizeScannerBase],
+) -> None:
     """Test exclude folders are converted to absolute paths."""
-    scanner = MockScanner(
-        search_dir=str(tmp_path),
-        size_mb=100,
-        output_file=None,
-        size_unit=constants.SIZE_UNIT_MB,
-        no_size=False,
-        no_table=False,
-        verbose=False,
-    )
+    scanner = scanner_factory(MockScanner)
     for folder in scanner.exclude_folders_abs:
         assert os.path.isabs(folder)
+
+
+def test_path_trie_matches__respects_component_boundaries() -> None:
+    """Test the exclude trie matches whole path components only."""
+    trie = build_path_trie(["/System", "/var/log", "/Library/Kexts/"])
+    assert path_trie_matches(trie, "/System") is True
+    assert path_trie_matches(trie, "/System/Library/Frameworks") is True
+    assert path_trie_matches(trie, "/var/log/nginx") is True
+    assert path_trie_matches(trie, "/Library/Kexts") is True
+    assert path_trie_matches(trie, "/SystemData") is False
+    assert path_trie_matches(trie, "/var") is False
+    assert path_trie_matches(trie, "/var/logs") is False
+
+
+def test_add_to_path_trie__extends_existing_trie() -> None:
+    """Test paths added to an existing trie are matched with their subtrees."""
+    trie = build_path_trie([])
+    assert path_trie_matches(trie, "/data/media") is False
+    add_to_path_trie(trie, "/data/media")
+    assert path_trie_matches(trie, "/data/media/movies") is True
+    assert path_trie_matches(trie, "/data/mediacache") is False
+
+
+def test_exclude_folders_abs__setter_rebuilds_lookup(
+    tmp_path: Path, scanner_factory: Callable[..., SizeScannerBase]
+) -> None:
+    """Test assigning exclude_folders_abs changes which paths are skipped."""
+    scanner = scanner_factory(MockScanner)
+    excluded = str(tmp_path / "excluded")
+    scanner.exclude_folders_abs = [excluded]
+    assert scanner.should_skip_path(os.path.join(excluded, "child")) is True
+    assert scanner.should_skip_path(str(tmp_path / "included")) is False
+
+    scanner.exclude_folders_abs = []
+    assert scanner.should_skip_path(os.path.join(excluded, "child")) is False
+
+
+def test_exclude_folders_abs__defaults_are_shared(
+    scanner_factory: Callable[..., SizeScannerBase],
+) -> None:
+    """Test scanners share the precomputed default exclude lookup."""
+    first = scanner_factory(MockScanner)
+    second = scanner_factory(MockScanner)
+    assert first.exclude_folders_abs is constants.EXCLUDE_FOLDERS_ABS
+    assert first._exclude_trie is second._exclude_trie
+    assert first.should_skip_path("/System/Library") is True
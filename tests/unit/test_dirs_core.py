@@ -1,6 +1,5 @@
 """Unit tests for dirs.core module."""
 
-import logging
 import shutil
 from pathlib import Path
 from unittest.mock import patch
@@ -8,20 +7,16 @@ from unittest.mock import patch
 import pytest
 
 from find_large import constants
+from find_large.core import build_path_trie
 from find_large.dirs.core import find_large_dirs, get_dir_size
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "files"
 
 
+@pytest.mark.usefixtures("reset_root_logger")
 class TestGetDirSize:
     """Test cases for get_dir_size function."""
 
-    @pytest.fixture(autouse=True)
-    def reset_logging(self) -> None:
-        """Reset logging state before each test."""
-        logging.root.handlers = []
-        logging.root.setLevel(logging.WARNING)
-
     def test_get_dir_size_calculates_total_size(self, tmp_path: Path) -> None:
         """Test get_dir_size calculates total size of directory."""
         test_dir = tmp_path / "test_dir"
@@ -32,6 +27,28 @@ class TestGetDirSize:
         size = get_dir_size(str(test_dir))
         assert size == 200
 
+    def test_get_dir_size_includes_nested_and_hidden_entries(self, tmp_path: Path) -> None:
+        """Test get_dir_size sums files in subdirectories, including hidden ones."""
+        test_dir = tmp_path / "test_dir"
+        (test_dir / "sub" / ".hidden").mkdir(parents=True)
+        shutil.copyfile(FIXTURES_DIR / "small_100.txt", test_dir / "file1.txt")
+        shutil.copyfile(FIXTURES_DIR / "small_100.txt", test_dir / "sub" / "file2.txt")
+        shutil.copyfile(FIXTURES_DIR / "small_100.txt", test_dir / "sub" / ".hidden" / ".file3")
+
+        assert get_dir_size(str(test_dir)) == 300
+
+    def test_get_dir_size_skips_symlinks(self, tmp_path: Path) -> None:
+        """Test get_dir_size neither follows nor counts symlinks."""
+        test_dir = tmp_path / "test_dir"
+        test_dir.mkdir()
+        target = tmp_path / "target.txt"
+        shutil.copyfile(FIXTURES_DIR / "small_100.txt", target)
+        shutil.copyfile(FIXTURES_DIR / "small_100.txt", test_dir / "file1.txt")
+        (test_dir / "link.txt").symlink_to(target)
+        (test_dir / "link_dir").symlink_to(tmp_path, target_is_directory=True)
+
+        assert get_dir_size(str(test_dir)) == 100
+
     def test_get_dir_size_handles_permission_errors(self, tmp_path: Path) -> None:
         """Test get_dir_size handles permission errors gracefully."""
         test_dir = tmp_path / "test_dir"
@@ -69,15 +86,10 @@ class TestGetDirSize:
             pass
 
 
+@pytest.mark.usefixtures("reset_root_logger")
 class TestFindLargeDirs:
     """Test cases for find_large_dirs function."""
 
-    @pytest.fixture(autouse=True)
-    def reset_logging(self) -> None:
-        """Reset logging state before each test."""
-        logging.root.handlers = []
-        logging.root.setLevel(logging.WARNING)
-
     def test_find_large_dirs_finds_large_directories(self, tmp_path: Path) -> None:
         """Test find_large_dirs finds directories above size threshold."""
         large_dir = tmp_path / "large_dir"
@@ -144,8 +156,8 @@ class TestFindLargeDirs:
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", large_dir / "file1.txt")
         output_file = tmp_path / "nonexistent" / "results.txt"
 
-        with patch("find_large.dirs.core.formatting.print_error"):
-            with patch("find_large.dirs.core.sys.exit") as mock_exit:
+        with patch("find_large.core.formatting.print_error"):
+            with patch("find_large.core.sys.exit") as mock_exit:
                 find_large_dirs(str(tmp_path), 0.001, str(output_file), constants.SIZE_UNIT_MB)
                 mock_exit.assert_called_once_with(1)
 
@@ -161,8 +173,12 @@ class TestFindLargeDirs:
         normal_dir.mkdir()
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", normal_dir / "file2.txt")
 
-        # Mock EXCLUDE_FOLDERS to include our test directory
-        with patch("find_large.dirs.core.EXCLUDE_FOLDERS", [str(excluded_dir)]):
+        # Replace the default excludes with our test directory
+        with patch.multiple(
+            "find_large.core",
+            EXCLUDE_FOLDERS_ABS=(str(excluded_dir),),
+            DEFAULT_EXCLUDE_TRIE=build_path_trie([str(excluded_dir)]),
+        ):
             find_large_dirs(str(tmp_path), 0.001, None, constants.SIZE_UNIT_MB, verbose=True)
 
     def test_find_large_dirs_handles_hidden_directories(self, tmp_path: Path) -> None:
@@ -187,6 +203,28 @@ class TestFindLargeDirs:
 
         find_large_dirs(str(tmp_path), 0.001, None, constants.SIZE_UNIT_MB)
 
+    def test_find_large_dirs_lists_largest_first(self, tmp_path: Path) -> None:
+        """Test find_large_dirs lists directories in descending size order."""
+        search_dir = tmp_path / "search"
+        for name, fixture in [("a_small", "large_2k.bin"), ("b_large", "large_4k.bin")]:
+            (search_dir / name).mkdir(parents=True)
+            shutil.copyfile(FIXTURES_DIR / fixture, search_dir / name / "file.bin")
+        (search_dir / "b_large" / "nested").mkdir()
+        shutil.copyfile(FIXTURES_DIR / "large_3k.bin", search_dir / "b_large" / "nested" / "f.bin")
+        output_file = tmp_path / "results.txt"
+
+        find_large_dirs(
+            str(search_dir), 0.001, str(output_file), constants.SIZE_UNIT_MB, no_table=True
+        )
+
+        names = [line.split()[0] for line in output_file.read_text().splitlines()[:4]]
+        assert names == [
+            str(search_dir),
+            str(search_dir / "b_large"),
+            str(search_dir / "b_large" / "nested"),
+            str(search_dir / "a_small"),
+        ]
+
     def test_find_large_dirs_with_no_directories_found(self, tmp_path: Path) -> None:
         """Test find_large_dirs handles case with no directories found."""
         # Create only small files
@@ -1,6 +1,5 @@
 """Unit tests for files.core module."""
 
-import logging
 import shutil
 from pathlib import Path
 from unittest.mock import patch
@@ -8,54 +7,16 @@ from unittest.mock import patch
 import pytest
 
 from find_large import constants
-from find_large.files.core import error_exit, find_files, setup_logging
+from find_large.core import build_path_trie
+from find_large.files.core import find_files
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "files"
 
 
-class TestErrorExit:
-    """Test cases for error_exit function."""
-
-    def test_error_exit_prints_error_and_exits(self, tmp_path: Path) -> None:
-        """Test error_exit prints error message and exits."""
-        with patch("find_large.files.core.formatting.print_error") as mock_print:
-            with patch("find_large.files.core.sys.exit") as mock_exit:
-                error_exit("Test error")
-                mock_print.assert_called_once_with("Test error")
-                mock_exit.assert_called_once_with(1)
-
-
-class TestSetupLogging:
-    """Test cases for setup_logging function."""
-
-    @pytest.fixture(autouse=True)
-    def reset_logging(self) -> None:
-        """Reset logging state before each test."""
-        logging.root.handlers = []
-        logging.root.setLevel(logging.WARNING)
-
-    def test_setup_logging_verbose_true(self) -> None:
-        """Test setup_logging with verbose=True sets DEBUG level."""
-        setup_logging(True)
-        # Check that logging is configured
-        assert len(logging.root.handlers) > 0
-
-    def test_setup_logging_verbose_false(self) -> None:
-        """Test setup_logging with verbose=False sets INFO level."""
-        setup_logging(False)
-        # Check that logging is configured
-        assert len(logging.root.handlers) > 0
-
-
+@pytest.mark.usefixtures("reset_root_logger")
 class TestFindFiles:
     """Test cases for find_files function."""
 
-    @pytest.fixture(autouse=True)
-    def reset_logging(self) -> None:
-        """Reset logging state before each test."""
-        logging.root.handlers = []
-        logging.root.setLevel(logging.WARNING)
-
     def test_find_files_finds_large_files(self, tmp_path: Path) -> None:
         """Test find_files finds files above size threshold."""
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", tmp_path / "large.bin")
@@ -165,9 +126,10 @@ class TestFindFiles:
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", tmp_path / "large.bin")
         output_file = tmp_path / "nonexistent" / "results.txt"
 
-        with patch("find_large.files.core.error_exit") as mock_error_exit:
-            find_files(str(tmp_path), 0.001, str(output_file), constants.SIZE_UNIT_MB)
-            mock_error_exit.assert_called_once()
+        with patch("find_large.core.formatting.print_error"):
+            with patch("find_large.core.sys.exit") as mock_exit:
+                find_files(str(tmp_path), 0.001, str(output_file), constants.SIZE_UNIT_MB)
+                mock_exit.assert_called_once_with(1)
 
     def test_find_files_skips_excluded_directories(self, tmp_path: Path) -> None:
         """Test find_files skips excluded directories."""
@@ -181,8 +143,12 @@ class TestFindFiles:
         normal_dir.mkdir()
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", normal_dir / "large.bin")
 
-        # Mock EXCLUDE_FOLDERS to include our test directory
-        with patch("find_large.files.core.EXCLUDE_FOLDERS", [str(excluded_dir)]):
+        # Replace the default excludes with our test directory
+        with patch.multiple(
+            "find_large.core",
+            EXCLUDE_FOLDERS_ABS=(str(excluded_dir),),
+            DEFAULT_EXCLUDE_TRIE=build_path_trie([str(excluded_dir)]),
+        ):
             find_files(str(tmp_path), 0.001, None, constants.SIZE_UNIT_MB, verbose=True)
 
     def test_find_files_finds_multiple_files(self, tmp_path: Path) -> None:
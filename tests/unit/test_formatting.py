@@ -23,6 +23,15 @@ def test_print_ascii_art__vids_command() -> None:
     formatting.print_ascii_art("vids")
 
 
+def test_render_ascii_art__highlights_active_command() -> None:
+    """Test the rendered banner marks only the active command as active."""
+    banner = formatting.render_ascii_art("dirs")
+    active = formatting.STYLES["active_command"]
+    assert f"[{active}]DIRS[/{active}]" in banner
+    assert f"[{active}]FILES" not in banner
+    assert formatting.render_ascii_art("dirs") is banner
+
+
 def test_print_error__displays_message() -> None:
     """Test error message is printed correctly."""
     formatting.print_error("Test error message")
@@ -105,6 +114,28 @@ def test_format_table__to_file_console() -> None:
     )
 
 
+def test_format_table__keeps_brackets_in_paths() -> None:
+    """Test paths containing markup-like brackets are printed verbatim."""
+    data_lines = [
+        ("Location", "Size"),
+        ("/media/[bold]clip[/bold] :smile:.mkv", "1.00 GB"),
+    ]
+    for no_table in (False, True):
+        file_console = Console(file=StringIO(), width=200)
+        formatting.format_table(
+            data_lines, total_bytes=1024**3, file_console=file_console, no_table=no_table
+        )
+        assert "/media/[bold]clip[/bold] :smile:.mkv" in file_console.file.getvalue()
+
+
+def test_print_plain_row__does_not_wrap_long_paths() -> None:
+    """Test a plain-text row stays on one line however long the path is."""
+    file_console = Console(file=StringIO(), width=40)
+    path = "/media/" + "a" * 100 + ".mkv"
+    formatting.print_plain_row(file_console, (path, "1.00 GB"))
+    assert file_console.file.getvalue().splitlines()[0].startswith(path)
+
+
 def test_get_status_context__returns_status() -> None:
     """Test status context creation."""
     status = formatting.get_status_context("Processing...")
@@ -125,3 +156,15 @@ def test_format_table__total_size_units(total_bytes: int, expected_unit: str) ->
     """Test total size displays correct units."""
     data_lines = [("Location", "Size"), ("/path/to/file.txt", "1.00 GB")]
     formatting.format_table(data_lines, no_size=False, total_bytes=total_bytes, no_table=True)
+
+
+def test_format_table__large_results_use_aligned_rows() -> None:
+    """Test results above MAX_TABLE_ROWS are printed as aligned text rows."""
+    rows = formatting.MAX_TABLE_ROWS + 1
+    data_lines = [("Location", "Size")] + [(f"/data/file{i}.bin", "1.00 MB") for i in range(rows)]
+    file_console = Console(file=StringIO(), force_terminal=False, width=80)
+    formatting.format_table(data_lines, total_bytes=rows * 1024 * 1024, file_console=file_console)
+    lines = file_console.file.getvalue().splitlines()
+    assert lines[0].split() == ["File", "Location", "File", "Size"]
+    assert lines[1] == f"{'/data/file0.bin'.ljust(len('/data/file500.bin'))}       1.00 MB"
+    assert "Total Size Summary" in lines[rows + 2]
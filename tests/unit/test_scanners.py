@@ -1,7 +1,10 @@
 """Unit tests for scanner modules."""
 
 import shutil
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
@@ -15,6 +18,18 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "files"
 VIDEO_FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "videos"
 
 
+@pytest.fixture
+def make_scanner(scanner_factory: Callable[..., SizeScannerBase]) -> Callable[..., SizeScannerBase]:
+    """Build scanners with a threshold of about 1 KB that ignore the default exclude folders.
+
+    The defaults exclude system folders, and on macOS ``tmp_path`` lies inside one.
+
+    Returns:
+        Callable[..., SizeScannerBase]: ``scanner_factory`` with these defaults.
+    """
+    return partial(scanner_factory, size_mb=0.001, exclude_folders_abs=())
+
+
 @pytest.fixture
 def sample_file_tree(tmp_path: Path) -> Path:
     """Create a sample file tree for testing.
@@ -65,85 +80,59 @@ class TestFileScanner:
         """Test FileScanner is a subclass of SizeScannerBase."""
         assert issubclass(FileScanner, SizeScannerBase)
 
-    def test_scan__finds_large_files(self, sample_file_tree: Path) -> None:
+    def test_scan__finds_large_files(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
         """Test scanner finds files above size threshold."""
-        # Mock exclude folders to avoid excluding tmp_path on macOS
-        scanner = FileScanner(
-            search_dir=str(sample_file_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        # Clear exclude folders to allow scanning
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(FileScanner, sample_file_tree)
         scanner.scan()
         assert len(scanner.items_list) == 3
         assert any("large.bin" in path for path, _ in scanner.items_list)
         assert any("file1.txt" in path for path, _ in scanner.items_list)
         assert any("file3.txt" in path for path, _ in scanner.items_list)
 
-    def test_scan__skips_small_files(self, sample_file_tree: Path) -> None:
+    def test_run__top_keeps_largest_files(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
+        """Test top keeps only the largest files, ordered largest first."""
+        scanner = make_scanner(FileScanner, sample_file_tree, top=2)
+        scanner.scan()
+        scanner.finish_top_items()
+        assert [Path(path).name for path, _ in scanner.items_list] == ["file3.txt", "file1.txt"]
+        assert scanner.items_found == 3
+        assert scanner.total_bytes == 4096 + 3072
+
+    def test_scan__skips_small_files(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
         """Test scanner skips files below size threshold."""
-        scanner = FileScanner(
-            search_dir=str(sample_file_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(FileScanner, sample_file_tree)
         scanner.size_bytes_threshold = 5120
         scanner.scan()
         assert len(scanner.items_list) == 0
 
-    def test_scan__skips_hidden_files(self, sample_file_tree: Path) -> None:
+    def test_scan__skips_hidden_files(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
         """Test scanner skips hidden files."""
-        scanner = FileScanner(
-            search_dir=str(sample_file_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(FileScanner, sample_file_tree)
         scanner.scan()
         assert not any(".hidden_file" in path for path, _ in scanner.items_list)
 
-    def test_scan__calculates_total_bytes(self, sample_file_tree: Path) -> None:
+    def test_scan__calculates_total_bytes(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
         """Test scanner calculates total bytes correctly."""
-        scanner = FileScanner(
-            search_dir=str(sample_file_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(FileScanner, sample_file_tree)
         scanner.scan()
         expected_total = 2048 + 3072 + 4096
         assert scanner.total_bytes == expected_total
 
-    def test_scan__handles_permission_errors(self, tmp_path: Path) -> None:
+    def test_scan__handles_permission_errors(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path
+    ) -> None:
         """Test scanner handles permission errors gracefully."""
-        scanner = FileScanner(
-            search_dir=str(tmp_path),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(FileScanner, tmp_path)
         # Create a file that we'll make unreadable
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", tmp_path / "large.bin")
         # Make file unreadable (may not work on all systems)
@@ -159,18 +148,11 @@ class TestFileScanner:
             except Exception:
                 pass
 
-    def test_scan__handles_permission_errors_verbose(self, tmp_path: Path) -> None:
+    def test_scan__handles_permission_errors_verbose(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path
+    ) -> None:
         """Test scanner handles permission errors with verbose logging."""
-        scanner = FileScanner(
-            search_dir=str(tmp_path),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=True,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(FileScanner, tmp_path, verbose=True)
         # Create a file that we'll make unreadable
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", tmp_path / "large.bin")
         # Make file unreadable
@@ -186,18 +168,11 @@ class TestFileScanner:
             except Exception:
                 pass
 
-    def test_scan__handles_oserror(self, tmp_path: Path) -> None:
+    def test_scan__handles_oserror(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path
+    ) -> None:
         """Test scanner handles OSError gracefully."""
-        scanner = FileScanner(
-            search_dir=str(tmp_path),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=True,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(FileScanner, tmp_path, verbose=True)
         # Create a file that we'll make unreadable
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", tmp_path / "large.bin")
         # Make file unreadable
@@ -213,21 +188,25 @@ class TestFileScanner:
             except Exception:
                 pass
 
-    def test_scan__with_verbose_logging(self, sample_file_tree: Path) -> None:
+    def test_scan__with_verbose_logging(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
         """Test scanner with verbose logging enabled."""
-        scanner = FileScanner(
-            search_dir=str(sample_file_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=True,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(FileScanner, sample_file_tree, verbose=True)
         scanner.scan()
         assert len(scanner.items_list) > 0
 
+    def test_scan__parallel_matches_serial(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
+        """Test scanner finds the same files with multiple jobs."""
+        results = []
+        for jobs in (1, 4):
+            scanner = make_scanner(FileScanner, sample_file_tree, jobs=jobs)
+            scanner.scan()
+            results.append((sorted(scanner.items_list), scanner.total_bytes))
+        assert results[0] == results[1]
+
 
 class TestDirectoryScanner:
     """Test cases for DirectoryScanner."""
@@ -236,71 +215,129 @@ class TestDirectoryScanner:
         """Test DirectoryScanner is a subclass of SizeScannerBase."""
         assert issubclass(DirectoryScanner, SizeScannerBase)
 
-    def test_scan__finds_large_directories(self, sample_file_tree: Path) -> None:
+    def test_scan__top_counts_nested_directories_once(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path
+    ) -> None:
+        """Test top lists a parent before a same-sized subdirectory and counts it once."""
+        nested = tmp_path / "only" / "nested"
+        nested.mkdir(parents=True)
+        shutil.copyfile(FIXTURES_DIR / "large_2k.bin", nested / "file.bin")
+        scanner = make_scanner(DirectoryScanner, tmp_path, top=2)
+        scanner.scan()
+        scanner.finish_top_items()
+        assert [path for path, _ in scanner.items_list] == [str(tmp_path), str(tmp_path / "only")]
+        assert scanner.total_bytes == 2048
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_scan__aggregates_nested_sizes(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path, jobs: int
+    ) -> None:
+        """Test every directory's size includes all of its descendants."""
+        deep = tmp_path / "a" / "b" / "c"
+        deep.mkdir(parents=True)
+        (tmp_path / "a" / "d").mkdir()
+        shutil.copyfile(FIXTURES_DIR / "small_100.txt", tmp_path / "top.txt")
+        shutil.copyfile(FIXTURES_DIR / "large_2k.bin", tmp_path / "a" / "b" / "mid.bin")
+        shutil.copyfile(FIXTURES_DIR / "large_3k.bin", deep / "deep.bin")
+        shutil.copyfile(FIXTURES_DIR / "large_4k.bin", tmp_path / "a" / "d" / "side.bin")
+
+        scanner = make_scanner(DirectoryScanner, tmp_path, jobs=jobs)
+        scanner.scan()
+
+        for path, size_bytes in scanner.dir_sizes.items():
+            expected = sum(f.stat().st_size for f in Path(path).rglob("*") if f.is_file())
+            assert size_bytes == expected
+
+    def test_scan__filesystem_root_is_not_added_to_itself(
+        self, make_scanner: Callable[..., SizeScannerBase], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test scanning from ``/`` counts the root's own files once."""
+        scanner = make_scanner(DirectoryScanner, "/", size_mb=0.00001)
+        walk = [("/", [("/a.bin", 100)]), ("/x", [("/x/b.bin", 50)])]
+        monkeypatch.setattr(scanner, "walk", lambda: iter(walk))
+        scanner.scan()
+        assert scanner.items_list == (("/", 150), ("/x", 50))
+        assert scanner.total_bytes == 150
+
+    def test_scan__finds_large_directories(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
         """Test scanner finds directories above size threshold."""
-        scanner = DirectoryScanner(
-            search_dir=str(sample_file_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(DirectoryScanner, sample_file_tree)
         scanner.scan()
         # Should find dir1, dir2, and root directory
         assert len(scanner.items_list) >= 2
 
-    def test_scan__calculates_recursive_sizes(self, sample_file_tree: Path) -> None:
+    def test_scan__calculates_recursive_sizes(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
         """Test scanner calculates recursive directory sizes."""
-        scanner = DirectoryScanner(
-            search_dir=str(sample_file_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(DirectoryScanner, sample_file_tree)
         scanner.scan()
         # dir1 should have 3072 + 100 bytes
         dir1_size = next((size for path, size in scanner.items_list if "dir1" in path), 0)
         assert dir1_size >= 3072
 
-    def test_scan__skips_small_directories(self, sample_file_tree: Path) -> None:
+    def test_scan__skips_small_directories(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
         """Test scanner skips directories below size threshold."""
-        scanner = DirectoryScanner(
-            search_dir=str(sample_file_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(DirectoryScanner, sample_file_tree)
         scanner.size_bytes_threshold = 10240
         scanner.scan()
         # No directory should be >= 10KB
         assert len(scanner.items_list) == 0
 
-    def test_scan__calculates_total_without_double_counting(self, sample_file_tree: Path) -> None:
+    def test_scan__calculates_total_without_double_counting(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
         """Test scanner calculates total without double-counting nested directories."""
-        scanner = DirectoryScanner(
-            search_dir=str(sample_file_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(DirectoryScanner, sample_file_tree)
         scanner.scan()
         # Total should be sum of non-overlapping directories
         assert scanner.total_bytes > 0
+        # Every match is nested in the search directory, which is counted once
+        assert scanner.total_bytes == scanner.dir_sizes[str(sample_file_tree)]
+
+    def test_scan__counts_total_of_streamed_directories(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
+        """Test the total is counted while rows go straight to a columnar writer."""
+        scanner = make_scanner(DirectoryScanner, sample_file_tree)
+        scanner._columnar_writer = Mock()
+        scanner.scan()
+        assert scanner.items_list == ()
+        assert scanner._columnar_writer.write.call_count == scanner.items_found
+        assert scanner.total_bytes == scanner.dir_sizes[str(sample_file_tree)]
+
+    def test_scan__no_size_skips_total(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
+        """Test scanner still lists directories but skips the total without sizes."""
+        scanner = make_scanner(DirectoryScanner, sample_file_tree, no_size=True)
+        scanner.scan()
+        assert any("dir2" in path for path, _ in scanner.items_list)
+        assert scanner.total_bytes == 0
+
+    def test_scan__no_size_lists_same_directories(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
+        """Test stopping at the threshold without sizes lists the same directories."""
+        (sample_file_tree / "dir3").mkdir()
+        shutil.copyfile(FIXTURES_DIR / "large_2k.bin", sample_file_tree / "dir3" / "a.bin")
+        shutil.copyfile(FIXTURES_DIR / "large_2k.bin", sample_file_tree / "dir3" / "b.bin")
+        results = []
+        for no_size in (False, True):
+            scanner = make_scanner(DirectoryScanner, sample_file_tree, no_size=no_size)
+            scanner.size_bytes_threshold = 2048
+            scanner.scan()
+            results.append(scanner)
+        sized, unsized = results
+        assert [path for path, _ in unsized.items_list] == [path for path, _ in sized.items_list]
+        # Either of dir3's files reaches the threshold, so the other is not sized
+        dir3 = str(sample_file_tree / "dir3")
+        assert sized.dir_sizes[dir3] == 4096
+        assert unsized.dir_sizes[dir3] == 2048
 
     def test_scan__initializes_dir_sizes_dict(self, sample_file_tree: Path) -> None:
         """Test scanner initializes dir_sizes dictionary."""
@@ -316,18 +353,22 @@ class TestDirectoryScanner:
         assert hasattr(scanner, "dir_sizes")
         assert isinstance(scanner.dir_sizes, dict)
 
-    def test_scan__handles_permission_errors(self, tmp_path: Path) -> None:
+    def test_scan__parallel_matches_serial(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_file_tree: Path
+    ) -> None:
+        """Test scanner aggregates the same directory sizes with multiple jobs."""
+        results = []
+        for jobs in (1, 4):
+            scanner = make_scanner(DirectoryScanner, sample_file_tree, jobs=jobs)
+            scanner.scan()
+            results.append((sorted(scanner.items_list), scanner.total_bytes))
+        assert results[0] == results[1]
+
+    def test_scan__handles_permission_errors(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path
+    ) -> None:
         """Test scanner handles permission errors gracefully."""
-        scanner = DirectoryScanner(
-            search_dir=str(tmp_path),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(DirectoryScanner, tmp_path)
         # Create a file that we'll make unreadable
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", tmp_path / "large.bin")
         # Make file unreadable
@@ -343,18 +384,11 @@ class TestDirectoryScanner:
             except Exception:
                 pass
 
-    def test_scan__handles_permission_errors_verbose(self, tmp_path: Path) -> None:
+    def test_scan__handles_permission_errors_verbose(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path
+    ) -> None:
         """Test scanner handles permission errors with verbose logging."""
-        scanner = DirectoryScanner(
-            search_dir=str(tmp_path),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=True,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(DirectoryScanner, tmp_path, verbose=True)
         # Create a file that we'll make unreadable
         shutil.copyfile(FIXTURES_DIR / "large_2k.bin", tmp_path / "large.bin")
         # Make file unreadable
@@ -440,81 +474,58 @@ class TestVideoScanner:
         assert scanner.is_video_file("image.jpg") is False
         assert scanner.is_video_file("archive.zip") is False
 
-    def test_scan__finds_large_video_files(self, sample_video_tree: Path) -> None:
-        """Test scanner finds large video files."""
+    def test_is_video_file__requires_extension(self) -> None:
+        """Test is_video_file rejects names that only look like an extension."""
         scanner = VideoScanner(
-            search_dir=str(sample_video_tree),
-            size_mb=0.001,
+            search_dir="/tmp",
+            size_mb=1,
             output_file=None,
             size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
         )
-        scanner.exclude_folders_abs = []
+        assert scanner.is_video_file("mp4") is False
+        assert scanner.is_video_file(".mp4") is False
+        assert scanner.is_video_file("clip.tar.mkv") is True
+
+    def test_scan__finds_large_video_files(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_video_tree: Path
+    ) -> None:
+        """Test scanner finds large video files."""
+        scanner = make_scanner(VideoScanner, sample_video_tree)
         scanner.scan()
         assert len(scanner.items_list) == 2
         assert any("large.mp4" in path for path, _ in scanner.items_list)
         assert any("movie.avi" in path for path, _ in scanner.items_list)
 
-    def test_scan__skips_non_video_files(self, sample_video_tree: Path) -> None:
+    def test_scan__skips_non_video_files(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_video_tree: Path
+    ) -> None:
         """Test scanner skips non-video files even if large."""
-        scanner = VideoScanner(
-            search_dir=str(sample_video_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(VideoScanner, sample_video_tree)
         scanner.scan()
         assert not any("not_video.txt" in path for path, _ in scanner.items_list)
 
-    def test_scan__skips_small_video_files(self, sample_video_tree: Path) -> None:
+    def test_scan__skips_small_video_files(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_video_tree: Path
+    ) -> None:
         """Test scanner skips small video files."""
-        scanner = VideoScanner(
-            search_dir=str(sample_video_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(VideoScanner, sample_video_tree)
         scanner.scan()
         assert not any("small.mkv" in path for path, _ in scanner.items_list)
 
-    def test_scan__calculates_total_bytes(self, sample_video_tree: Path) -> None:
+    def test_scan__calculates_total_bytes(
+        self, make_scanner: Callable[..., SizeScannerBase], sample_video_tree: Path
+    ) -> None:
         """Test scanner calculates total bytes correctly."""
-        scanner = VideoScanner(
-            search_dir=str(sample_video_tree),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(VideoScanner, sample_video_tree)
         scanner.scan()
         expected_total = 2048 + 3072
         assert scanner.total_bytes == expected_total
 
-    def test_scan__handles_permission_errors(self, tmp_path: Path) -> None:
+    def test_scan__handles_permission_errors(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path
+    ) -> None:
         """Test scanner handles permission errors gracefully."""
-        scanner = VideoScanner(
-            search_dir=str(tmp_path),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=False,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(VideoScanner, tmp_path)
         # Create a video file that we'll make unreadable
         shutil.copyfile(VIDEO_FIXTURES_DIR / "large_2k.mp4", tmp_path / "large.mp4")
         # Make file unreadable
@@ -530,18 +541,11 @@ class TestVideoScanner:
             except Exception:
                 pass
 
-    def test_scan__handles_permission_errors_verbose(self, tmp_path: Path) -> None:
+    def test_scan__handles_permission_errors_verbose(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path
+    ) -> None:
         """Test scanner handles permission errors with verbose logging."""
-        scanner = VideoScanner(
-            search_dir=str(tmp_path),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=True,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(VideoScanner, tmp_path, verbose=True)
         # Create a video file that we'll make unreadable
         shutil.copyfile(VIDEO_FIXTURES_DIR / "large_2k.mp4", tmp_path / "large.mp4")
         # Make file unreadable
@@ -557,18 +561,11 @@ class TestVideoScanner:
             except Exception:
                 pass
 
-    def test_scan__handles_oserror(self, tmp_path: Path) -> None:
+    def test_scan__handles_oserror(
+        self, make_scanner: Callable[..., SizeScannerBase], tmp_path: Path
+    ) -> None:
         """Test scanner handles OSError gracefully."""
-        scanner = VideoScanner(
-            search_dir=str(tmp_path),
-            size_mb=0.001,
-            output_file=None,
-            size_unit=constants.SIZE_UNIT_MB,
-            no_size=False,
-            no_table=False,
-            verbose=True,
-        )
-        scanner.exclude_folders_abs = []
+        scanner = make_scanner(VideoScanner, tmp_path, verbose=True)
         # Create a video file that we'll make unreadable
         shutil.copyfile(VIDEO_FIXTURES_DIR / "large_2k.mp4", tmp_path / "large.mp4")
         # Make file unreadable
@@ -1,6 +1,5 @@
 """Unit tests for videos.core module."""
 
-import logging
 import shutil
 from pathlib import Path
 from unittest.mock import patch
@@ -8,6 +7,7 @@ from unittest.mock import patch
 import pytest
 
 from find_large import constants
+from find_large.core import build_path_trie
 from find_large.videos.core import find_large_videos, is_video_file
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "videos"
@@ -36,15 +36,10 @@ class TestIsVideoFile:
         assert is_video_file("archive.zip") is False
 
 
+@pytest.mark.usefixtures("reset_root_logger")
 class TestFindLargeVideos:
     """Test cases for find_large_videos function."""
 
-    @pytest.fixture(autouse=True)
-    def reset_logging(self) -> None:
-        """Reset logging state before each test."""
-        logging.root.handlers = []
-        logging.root.setLevel(logging.WARNING)
-
     def test_find_large_videos_finds_large_videos(self, tmp_path: Path) -> None:
         """Test find_large_videos finds large video files."""
         shutil.copyfile(FIXTURES_DIR / "large_2k.mp4", tmp_path / "large.mp4")
@@ -135,7 +130,7 @@ class TestFindLargeVideos:
         shutil.copyfile(FIXTURES_DIR / "large_2k.mp4", tmp_path / "large.mp4")
         output_file = tmp_path / "nonexistent" / "results.txt"
 
-        with patch("find_large.videos.core.sys.exit") as mock_exit:
+        with patch("find_large.core.sys.exit") as mock_exit:
             find_large_videos(str(tmp_path), 0.001, str(output_file), constants.SIZE_UNIT_MB)
             mock_exit.assert_called_once_with(1)
 
@@ -151,8 +146,12 @@ class TestFindLargeVideos:
         normal_dir.mkdir()
         shutil.copyfile(FIXTURES_DIR / "large_2k.mp4", normal_dir / "large.mp4")
 
-        # Mock EXCLUDE_FOLDERS to include our test directory
-        with patch("find_large.videos.core.EXCLUDE_FOLDERS", [str(excluded_dir)]):
+        # Replace the default excludes with our test directory
+        with patch.multiple(
+            "find_large.core",
+            EXCLUDE_FOLDERS_ABS=(str(excluded_dir),),
+            DEFAULT_EXCLUDE_TRIE=build_path_trie([str(excluded_dir)]),
+        ):
             find_large_videos(str(tmp_path), 0.001, None, constants.SIZE_UNIT_MB, verbose=True)
 
     def test_find_large_videos_skips_hidden_files(self, tmp_path: Path) -> None:
@@ -169,6 +168,26 @@ class TestFindLargeVideos:
 
         find_large_videos(str(tmp_path), 0.001, None, constants.SIZE_UNIT_MB)
 
+    def test_find_large_videos_lists_largest_first(self, tmp_path: Path) -> None:
+        """Test find_large_videos lists videos in descending size order."""
+        search_dir = tmp_path / "search"
+        (search_dir / "sub").mkdir(parents=True)
+        shutil.copyfile(FIXTURES_DIR / "large_2k.mp4", search_dir / "small.mp4")
+        shutil.copyfile(FIXTURES_DIR / "large_5k.mp4", search_dir / "sub" / "large.mp4")
+        shutil.copyfile(FIXTURES_DIR / "large_3k.avi", search_dir / "medium.avi")
+        output_file = tmp_path / "results.txt"
+
+        find_large_videos(
+            str(search_dir), 0.001, str(output_file), constants.SIZE_UNIT_MB, no_table=True
+        )
+
+        names = [line.split()[0] for line in output_file.read_text().splitlines()[:3]]
+        assert names == [
+            str(search_dir / "sub" / "large.mp4"),
+            str(search_dir / "medium.avi"),
+            str(search_dir / "small.mp4"),
+        ]
+
     def test_find_large_videos_with_no_videos_found(self, tmp_path: Path) -> None:
         """Test find_large_videos handles case with no videos found."""
         # Create only non-video files
@@ -193,6 +212,22 @@ class TestFindLargeVideos:
 
         assert output_file.exists()
 
+    def test_find_large_videos_skips_symlinks(self, tmp_path: Path) -> None:
+        """Test find_large_videos does not list symlinks to videos."""
+        search_dir = tmp_path / "search"
+        search_dir.mkdir()
+        shutil.copyfile(FIXTURES_DIR / "large_2k.mp4", search_dir / "large.mp4")
+        (search_dir / "link.mp4").symlink_to(search_dir / "large.mp4")
+        output_file = tmp_path / "results.txt"
+
+        find_large_videos(
+            str(search_dir), 0.001, str(output_file), constants.SIZE_UNIT_MB, no_table=True
+        )
+
+        content = output_file.read_text()
+        assert "large.mp4" in content
+        assert "link.mp4" not in content
+
     def test_find_large_videos_handles_hidden_directories(self, tmp_path: Path) -> None:
         """Test find_large_videos skips hidden directories."""
         hidden_dir = tmp_path / ".hidden"